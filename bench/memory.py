@@ -0,0 +1,92 @@
+#
+# This file is part of ArgProc. ArgProc is free software that is made
+# available under the MIT license. Consult the file "LICENSE" that is
+# distributed together with this file for the exact licensing terms.
+#
+# ArgProc is copyright (c) 2010 by the ArgProc authors. See the file
+# "AUTHORS" for a complete overview.
+
+"""Measure the memory used by the parsed rules of many processors.
+
+A corpus of processors is created that share common fragments, the way
+processors in an application do. The memory that the rules retain is
+compared to the memory they would retain if every processor had its own
+copy of its nodes.
+"""
+
+import sys
+import random
+from optparse import OptionParser
+
+from argproc import ArgumentProcessor
+
+fragments = [
+    "$id:int => $id *",
+    "$name <=> $name *",
+    "$type:set(('person', 'company', 'group')) <=> $type",
+    "$status:set(('active', 'inactive')) <=> $status",
+    "$email:/[^@]+@[^@]+/ <=> $email",
+    "$age:0..150 <=> $age",
+    "int($count) <=> str($count)",
+    "$street <=> $address.street",
+    "$city <=> $address.city",
+    "$zipcode:/[0-9]{4}[A-Z]{2}/ <=> $address.zipcode",
+    "$phone <=> $contact.phone",
+    "$created:is int => $created",
+]
+
+
+def sizeof(node):
+    """Return the number of bytes retained by `node' itself."""
+    size = sys.getsizeof(node) + sys.getsizeof(node.__dict__)
+    size += sys.getsizeof(node.children)
+    return size
+
+
+def measure(processors):
+    """Return a tuple (shared, unshared), the number of bytes that the nodes
+    of `processors' retain, and would retain without sharing."""
+    shared = 0
+    unshared = 0
+    seen = set()
+    for proc in processors:
+        for rule in proc._ruleset.rules:
+            # Nodes are only shared within a rule if it is a single
+            # expression <=> rule.
+            nodes = dict((id(node), node) for side in (rule.left, rule.right)
+                         for node in side.walk())
+            for node in nodes.values():
+                size = sizeof(node)
+                unshared += size
+                if id(node) not in seen:
+                    seen.add(id(node))
+                    shared += size
+    return shared, unshared
+
+
+def main():
+    parser = OptionParser(usage='%prog [options]',
+                          description=__doc__.strip().split('\n')[0])
+    parser.add_option('-n', '--processors', type='int', default=500,
+                      help='number of processors')
+    parser.add_option('-r', '--rules', type='int', default=8,
+                      help='number of rules per processor')
+    opts, args = parser.parse_args()
+    random.seed(0)
+    processors = []
+    for i in range(opts.processors):
+        proc = ArgumentProcessor(namespace={})
+        rules = random.sample(fragments, opts.rules)
+        rules.append('$field%d <=> $field%d' % (i, i))
+        proc.rules('\n'.join(rules))
+        processors.append(proc)
+    shared, unshared = measure(processors)
+    print 'Processors:        %d' % opts.processors
+    print 'Rules:             %d' % (opts.processors * (opts.rules + 1))
+    print 'Bytes (unshared):  %d' % unshared
+    print 'Bytes (shared):    %d' % shared
+    print 'Reduction:         %.1f%%' % (100.0 * (unshared - shared) / unshared)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+#
+# This file is part of ArgProc. ArgProc is free software that is made
+# available under the MIT license. Consult the file "LICENSE" that is
+# distributed together with this file for the exact licensing terms.
+#
+# ArgProc is copyright (c) 2010 by the ArgProc authors. See the file
+# "AUTHORS" for a complete overview.
+
+"""Measure slicing large payloads with and without zero-copy mode.
+
+Rules that slice a header, a body and parts of the body out of a large
+payload are evaluated with copies and with memoryviews. The time per call
+and the number of bytes held by the result are reported.
+"""
+
+import sys
+from timeit import default_timer
+from optparse import OptionParser
+
+from argproc import ArgumentProcessor
+
+rules = """
+    $data[0:4] => $magic
+    $data[4:12] => $length
+    $data[16:-16] => $body
+    $data[16:-16][0:65536] => $head
+    $data[16:-16][-65536:-1] => $tail
+    len($data[16:-16]) => $size
+    """
+
+
+def result_size(result):
+    """Return the number of bytes held by the values in `result'."""
+    return sum(sys.getsizeof(value) for value in result.values())
+
+
+def measure(proc, args, calls):
+    """Return a tuple (seconds per call, result size)."""
+    result = proc.process(args)
+    start = default_timer()
+    for i in range(calls):
+        proc.process(args)
+    elapsed = (default_timer() - start) / calls
+    return elapsed, result_size(result)
+
+
+def main():
+    parser = OptionParser(usage='%prog [options]',
+                          description=__doc__.strip().split('\n')[0])
+    parser.add_option('-s', '--size', type='int', default=8,
+                      help='payload size in megabytes')
+    parser.add_option('-n', '--calls', type='int', default=50,
+                      help='number of calls to time')
+    opts, args = parser.parse_args()
+    args = {'data': 'x' * (opts.size * 1024 * 1024)}
+    print 'Payload:           %d MB' % opts.size
+    for zero_copy in (False, True):
+        proc = ArgumentProcessor(namespace={'len': len}, zero_copy=zero_copy)
+        proc.rules(rules)
+        elapsed, size = measure(proc, args, opts.calls)
+        label = zero_copy and 'zero-copy' or 'copy'
+        print '%-10s         %8.3f ms per call, %10d bytes in result' % \
+                (label + ':', 1e3 * elapsed, size)
+
+
+if __name__ == '__main__':
+    main()
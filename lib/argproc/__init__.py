@@ -23,6 +23,12 @@ The rule language is designed to be human readable. Some examples below:
   concat($year:int, '-', $month:int, '-', $day:int) <=> split($date, '-')
 """
 
-from argproc.error import Error
+from argproc.error import Error, RuleWarning
 from argproc.processor import ArgumentProcessor
 from argproc.parser import ParseError, ValidationError
+from argproc.adapter import InputAdapter, AttributeAdapter, MultiDictAdapter
+from argproc.adapter import GetterAdapter, LazyAdapter
+from argproc.tracer import Tracer, MemoryTracer, LoggingTracer
+from argproc.loader import RuleLoader
+from argproc.registry import Registry, register, warm_up
+from argproc.executor import blocking
@@ -0,0 +1,12 @@
+#
+# This file is part of ArgProc. ArgProc is free software that is made
+# available under the MIT license. Consult the file "LICENSE" that is
+# distributed together with this file for the exact licensing terms.
+#
+# ArgProc is copyright (c) 2010 by the ArgProc authors. See the file
+# "AUTHORS" for a complete overview.
+
+import sys
+from argproc.cli import main
+
+sys.exit(main())
@@ -0,0 +1,102 @@
+#
+# This file is part of ArgProc. ArgProc is free software that is made
+# available under the MIT license. Consult the file "LICENSE" that is
+# distributed together with this file for the exact licensing terms.
+#
+# ArgProc is copyright (c) 2010 by the ArgProc authors. See the file
+# "AUTHORS" for a complete overview.
+
+_missing = object()
+
+
+class InputAdapter(object):
+    """Present an arbitrary object as a read-only mapping of fields.
+
+    Values are fetched from the source lazily, and at most once. If `fields'
+    is given, only those fields are ever looked up in the source. This
+    matters because rules consult the arguments before the namespace when
+    resolving a name.
+    """
+
+    def __init__(self, source, fields=None):
+        self.source = source
+        self.fields = fields
+        self._cache = {}
+
+    def fetch(self, name):
+        """Fetch field `name' from the source. Raise KeyError if the field
+        does not exist."""
+        raise NotImplementedError
+
+    def __getitem__(self, name):
+        try:
+            value = self._cache[name]
+        except KeyError:
+            if self.fields is not None and name not in self.fields:
+                raise KeyError(name)
+            try:
+                value = self.fetch(name)
+            except KeyError:
+                value = _missing
+            self._cache[name] = value
+        if value is _missing:
+            raise KeyError(name)
+        return value
+
+    def __contains__(self, name):
+        try:
+            self[name]
+        except KeyError:
+            return False
+        return True
+
+    def get(self, name, default=None):
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+
+class AttributeAdapter(InputAdapter):
+    """Fields are attributes of the source object (e.g. an ORM object)."""
+
+    def fetch(self, name):
+        try:
+            return getattr(self.source, name)
+        except AttributeError:
+            raise KeyError(name)
+
+
+class MultiDictAdapter(InputAdapter):
+    """Fields are the first value of a key in a multi-valued mapping, such as
+    cgi.FieldStorage or a request multidict."""
+
+    def fetch(self, name):
+        source = self.source
+        if hasattr(source, 'getlist'):
+            values = source.getlist(name)
+        elif hasattr(source, 'getall'):
+            values = source.getall(name)
+        else:
+            values = source[name]
+            if not isinstance(values, list):
+                values = [values]
+        if not values:
+            raise KeyError(name)
+        return values[0]
+
+
+class GetterAdapter(InputAdapter):
+    """The source is a callable that is called with a field name and returns
+    its value, or raises KeyError."""
+
+    def fetch(self, name):
+        return self.source(name)
+
+
+class LazyAdapter(InputAdapter):
+    """The source maps field names to callables that take no arguments and
+    return the value of the field."""
+
+    def fetch(self, name):
+        return self.source[name]()
@@ -0,0 +1,147 @@
+#
+# This file is part of ArgProc. ArgProc is free software that is made
+# available under the MIT license. Consult the file "LICENSE" that is
+# distributed together with this file for the exact licensing terms.
+#
+# ArgProc is copyright (c) 2010 by the ArgProc authors. See the file
+# "AUTHORS" for a complete overview.
+
+"""Transform a stream of JSON records according to a rule file.
+
+Every line of the input is a JSON object. It is processed by the rules and
+written as a JSON object to the output. Lines that cannot be processed are
+written to the reject stream, together with the error.
+"""
+
+import sys
+import json
+import time
+import itertools
+from optparse import OptionParser
+
+from argproc.error import Error
+from argproc.processor import ArgumentProcessor
+
+
+def load_processor(fname, tags=None, namespace=None):
+    """Create a processor for the rules in file `fname'. If `namespace' is
+    given, it is the name of a module that provides the names used in the
+    rules."""
+    if namespace is None:
+        globals = {}
+    else:
+        module = __import__(namespace, {}, {}, ['__name__'])
+        globals = vars(module).copy()
+    proc = ArgumentProcessor(namespace=globals, tags=tags)
+    proc.load([fname])
+    return proc
+
+
+_worker = None
+
+def _init_worker(fname, tags, namespace, reverse):
+    """Initialize a worker process."""
+    global _worker
+    proc = load_processor(fname, tags, namespace)
+    _worker = reverse and proc.process_reverse or proc.process
+
+def _transform(line):
+    """Transform one input line. Return a tuple (ok, line)."""
+    try:
+        record = json.loads(line)
+    except ValueError, e:
+        return False, json.dumps({'error': 'Invalid JSON: %s' % e,
+                                  'input': line.rstrip('\n')})
+    try:
+        result = _worker(record)
+        return True, json.dumps(result, sort_keys=True)
+    except Error, e:
+        error = str(e)
+        fields = e.fields
+    except Exception, e:
+        error = '%s: %s' % (e.__class__.__name__, e)
+        fields = None
+    return False, json.dumps({'error': error, 'fields': fields,
+                              'input': record}, sort_keys=True)
+
+
+def transform(fin, fout, frejects, initargs, workers=1, batch=1000):
+    """Transform the lines in `fin'. The processor is described by
+    `initargs', see _init_worker(). Return a tuple (processed, rejected)."""
+    if workers > 1:
+        import multiprocessing
+        pool = multiprocessing.Pool(workers, _init_worker, initargs)
+        imap = lambda lines: pool.imap(_transform, lines, batch // workers)
+    else:
+        _init_worker(*initargs)
+        pool = None
+        imap = lambda lines: itertools.imap(_transform, lines)
+    processed = rejected = 0
+    try:
+        while True:
+            # Read the input in batches, so that the memory use does not
+            # depend on the size of the input if we use workers.
+            lines = [ line for line in itertools.islice(fin, batch)
+                      if line.strip() ]
+            if not lines:
+                break
+            for ok, line in imap(lines):
+                if ok:
+                    fout.write(line + '\n')
+                else:
+                    frejects.write(line + '\n')
+                    rejected += 1
+            processed += len(lines)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    return processed, rejected
+
+
+def main(argv=None, stdin=None, stdout=None, stderr=None):
+    """Command-line entry point."""
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+    parser = OptionParser(usage='%prog [options] <rulefile> [<input>]',
+                          description=__doc__.strip().split('\n')[0])
+    parser.add_option('-r', '--reverse', action='store_true',
+                      help='process from right to left')
+    parser.add_option('-t', '--tag', dest='tags', action='append',
+                      metavar='TAG', help='select rules with tag TAG')
+    parser.add_option('-n', '--namespace', metavar='MODULE',
+                      help='resolve names in the rules in MODULE')
+    parser.add_option('-e', '--rejects', metavar='FILE',
+                      help='write rejected records to FILE (default stderr)')
+    parser.add_option('-j', '--workers', type='int', default=1,
+                      help='use this many worker processes')
+    parser.add_option('-q', '--quiet', action='store_true',
+                      help='do not report throughput')
+    opts, args = parser.parse_args(argv)
+    if len(args) not in (1, 2):
+        parser.error('specify a rule file and optionally an input file')
+    initargs = (args[0], opts.tags, opts.namespace, opts.reverse)
+    try:
+        # Load the rules once up front, to report errors early.
+        load_processor(*initargs[:3])
+    except (IOError, ImportError, Error), e:
+        stderr.write('error: %s\n' % e)
+        return 1
+    fin = len(args) == 2 and file(args[1]) or stdin
+    frejects = opts.rejects and file(opts.rejects, 'w') or stderr
+    start = time.time()
+    try:
+        processed, rejected = transform(fin, stdout, frejects, initargs,
+                                        max(1, opts.workers))
+    finally:
+        if fin is not stdin:
+            fin.close()
+        if frejects is not stderr:
+            frejects.close()
+    elapsed = time.time() - start
+    if not opts.quiet:
+        rate = processed / max(elapsed, 1e-6)
+        stderr.write('Processed %d records (%d rejected) in %.2fs, '
+                     '%.0f records/s\n' % (processed, rejected, elapsed, rate))
+    return 0
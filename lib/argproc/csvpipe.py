@@ -0,0 +1,133 @@
+#
+# This file is part of ArgProc. ArgProc is free software that is made
+# available under the MIT license. Consult the file "LICENSE" that is
+# distributed together with this file for the exact licensing terms.
+#
+# ArgProc is copyright (c) 2010 by the ArgProc authors. See the file
+# "AUTHORS" for a complete overview.
+
+import csv
+
+from argproc.error import Error, MissingFieldError
+
+
+class RowView(object):
+    """A read-only mapping view of a CSV row, addressed by column name.
+
+    The view is bound to a header once and then pointed at each row in turn,
+    so that no mapping is created per row.
+    """
+
+    def __init__(self, index):
+        self.index = index
+        self.row = ()
+
+    def __getitem__(self, name):
+        return self.row[self.index[name]]
+
+    def __contains__(self, name):
+        i = self.index.get(name)
+        return i is not None and i < len(self.row)
+
+
+class RowBuilder(object):
+    """A write-only mapping that assigns fields to positions in a row."""
+
+    def __init__(self, columns):
+        self.columns = columns
+        self.index = dict((columns[i], i) for i in range(len(columns)))
+        self.row = [None] * len(columns)
+
+    def reset(self):
+        for i in range(len(self.row)):
+            self.row[i] = None
+
+    def __getitem__(self, name):
+        value = self.row[self.index[name]]
+        if value is None:
+            raise KeyError(name)
+        return value
+
+    def __setitem__(self, name, value):
+        self.row[self.index[name]] = value
+
+    def update(self, items):
+        for name, value in items:
+            self.row[self.index[name]] = value
+
+
+class CSVTransformer(object):
+    """Transform CSV files according to the rules in a processor.
+
+    The header of the input is bound to the fields that the rules reference
+    once. After that, each row is evaluated directly from the list that the
+    CSV reader returns, and the output is written positionally, with one
+    column per output field in rule order.
+    """
+
+    def __init__(self, processor, reverse=False):
+        self.processor = processor
+        self.direction = reverse and '<=' or '=>'
+
+    def bind(self, header):
+        """Bind the rules to the column names in `header'. Return a tuple
+        (view, builder)."""
+        proc = self.processor
+        plan = proc._plan(self.direction)
+        index = dict((header[i], i) for i in range(len(header)))
+        for step in plan.steps:
+            if not step.rule.mandatory or proc.ignore_missing:
+                continue
+            missing = [ node.name for node in step.inputs
+                        if node.root not in index ]
+            if missing:
+                m = 'Required %s fields missing from header: %s' % \
+                        (step.iside, ', '.join(missing))
+                raise MissingFieldError(m, fields=missing, rule=step.rule)
+        columns = []
+        for step in plan.steps:
+            for node in step.outputs:
+                if node.root not in columns:
+                    columns.append(node.root)
+        return RowView(index), RowBuilder(columns)
+
+    def transform(self, fin, fout, rejects=None, dialect='excel'):
+        """Transform the CSV data in file `fin' and write it to `fout'.
+
+        If `rejects' is given, rows that cannot be processed, because of an
+        Error or any other exception, are written to it with the error in an
+        extra column. Otherwise the error is raised.
+        Return the number of rows that were processed.
+        """
+        proc = self.processor
+        plan = proc._plan(self.direction)
+        reader = csv.reader(fin, dialect)
+        try:
+            header = reader.next()
+        except StopIteration:
+            return 0
+        view, builder = self.bind(header)
+        writer = csv.writer(fout, dialect)
+        writer.writerow(builder.columns)
+        if rejects is not None:
+            rejects = csv.writer(rejects, dialect)
+            rejects.writerow(header + ['error'])
+        count = 0
+        for row in reader:
+            view.row = row
+            builder.reset()
+            count += 1
+            try:
+                proc._evaluate(view, plan, builder)
+            except Error, e:
+                if rejects is None:
+                    raise
+                rejects.writerow(row + [str(e)])
+                continue
+            except Exception, e:
+                if rejects is None:
+                    raise
+                rejects.writerow(row + ['%s: %s' % (e.__class__.__name__, e)])
+                continue
+            writer.writerow(builder.row)
+        return count
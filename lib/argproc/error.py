@@ -30,3 +30,7 @@ class ValidationError(Error):
 
 class MissingFieldError(Error):
     """A mandatory field is missing."""
+
+
+class RuleWarning(UserWarning):
+    """A rule set contains a questionable rule."""
@@ -0,0 +1,51 @@
+#
+# This file is part of ArgProc. ArgProc is free software that is made
+# available under the MIT license. Consult the file "LICENSE" that is
+# distributed together with this file for the exact licensing terms.
+#
+# ArgProc is copyright (c) 2010 by the ArgProc authors. See the file
+# "AUTHORS" for a complete overview.
+
+from argproc.parser import Name
+
+
+def blocking(func):
+    """Mark `func' as blocking. A processor that has an executor evaluates
+    the rules that call a blocking function concurrently."""
+    func.blocking = True
+    return func
+
+
+def _is_blocking(node, namespace):
+    """Return whether name `node' resolves to a blocking function."""
+    try:
+        value = eval(node.code, namespace)
+    except Exception:
+        return False
+    return getattr(value, 'blocking', False) is True
+
+
+def find_blocking(plan, namespace):
+    """Return the steps of `plan' that can be evaluated concurrently: the
+    steps that call a blocking function, and that are the only step that
+    assigns their output fields."""
+    steps = []
+    for i in range(len(plan.steps)):
+        step = plan.steps[i]
+        if [ node for node in step.outputs
+             if plan.writers[node.root] != [i] ]:
+            continue
+        for node in step.ispec.walk():
+            if isinstance(node, Name) and _is_blocking(node, namespace):
+                steps.append(step)
+                break
+    return steps
+
+
+def submit(executor, func, *args):
+    """Submit `func(*args)' to `executor', which is either a
+    concurrent.futures executor or a multiprocessing thread pool. Return a
+    function that waits for the result and returns it."""
+    if hasattr(executor, 'submit'):
+        return executor.submit(func, *args).result
+    return executor.apply_async(func, args).get
@@ -0,0 +1,124 @@
+#
+# This file is part of ArgProc. ArgProc is free software that is made
+# available under the MIT license. Consult the file "LICENSE" that is
+# distributed together with this file for the exact licensing terms.
+#
+# ArgProc is copyright (c) 2010 by the ArgProc authors. See the file
+# "AUTHORS" for a complete overview.
+
+import sys
+
+from argproc.parser import (Node, Literal, Tuple, List, Dict, Name,
+                            FunctionCall, AttributeReference, Slicing)
+
+# Node types whose value is the same on every evaluation.
+_constant_types = (Literal, Tuple, List, Dict)
+
+
+def _is_constant(node):
+    """Return whether `node' evaluates to the same value on every call."""
+    if type(node) is not Node and not isinstance(node, _constant_types):
+        return False
+    return all(_is_constant(child) for child in node)
+
+
+def _constants(node):
+    """Return the largest subtrees of `node' that are constant, excluding
+    plain literals."""
+    if _is_constant(node):
+        if isinstance(node, Literal):
+            return []
+        return [node]
+    return reduce(list.__add__, (_constants(child) for child in node), [])
+
+
+def _allocations(node):
+    """Estimate the number of objects that are allocated when `node' is
+    evaluated once, not including the objects it allocates for its
+    children, or that functions called by it allocate."""
+    if isinstance(node, (Tuple, List)):
+        return 2  # generator and result
+    elif isinstance(node, Dict):
+        return 2 + len(node)  # generator, result, and a tuple per item
+    elif isinstance(node, FunctionCall):
+        return 3  # argument list, argument tuple and result
+    elif isinstance(node, (AttributeReference, Slicing)):
+        return 1
+    return 0
+
+
+def _retained(nodes):
+    """Return the number of bytes retained by `nodes'."""
+    size = 0
+    seen = set()
+    for node in nodes:
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        size += sys.getsizeof(node) + sys.getsizeof(node.__dict__)
+        size += sys.getsizeof(node.children)
+        if isinstance(node, Literal):
+            size += sys.getsizeof(node.value)
+    return size
+
+
+def _resolve(node, namespace):
+    """Return a description of the value that name `node' resolves to."""
+    try:
+        value = eval(node.name, namespace)
+    except Exception, e:
+        return 'unresolved (%s)' % e.__class__.__name__
+    return repr(value)
+
+
+def explain_plan(plan, namespace, tags=None):
+    """Render `plan' as text. Names are resolved in `namespace'."""
+    lines = []
+    total_nodes = 0
+    total_allocations = 1  # the result
+    total_retained = 0
+    mapping = set()
+    for item in plan.mappings:
+        mapping.update(item.steps)
+    for i in range(len(plan.steps)):
+        step = plan.steps[i]
+        rule = step.rule
+        nodes = list(step.ispec.walk())
+        allocations = 1 + sum(_allocations(node) for node in nodes)
+        retained = _retained(list(rule.left.walk()) + list(rule.right.walk()))
+        total_nodes += len(nodes)
+        total_allocations += allocations
+        total_retained += retained
+        lines.append('[%d] %s' % (i+1, rule.tostring()))
+        lines.append('    tree:        %s' % step.ispec.show_tree())
+        assigns = ', '.join(node.tostring() for node in step.outputs)
+        if not step.store:
+            assigns = 'nothing (checks only)'
+        elif step in mapping:
+            assigns += ' (bulk field mapping)'
+        lines.append('    assigns:     %s' % assigns)
+        lines.append('    nodes:       %d evaluated per call' % len(nodes))
+        lines.append('    allocations: ~%d per call' % allocations)
+        lines.append('    retained:    %d bytes' % retained)
+        for node in nodes:
+            if isinstance(node, Name):
+                lines.append('    name:        %s = %s'
+                             % (node.name, _resolve(node, namespace)))
+        for node in _constants(step.ispec):
+            lines.append('    constant:    %s' % node.tostring())
+        if step.calls:
+            lines.append('    statistics:  %d calls, %d failures, '
+                         '%.1f us per call' % (step.calls, step.failures,
+                         1e6 * step.elapsed / step.calls))
+    if tags is None:
+        tags = 'any'
+    else:
+        tags = ', '.join(sorted(tags)) or 'none'
+    fields = ', '.join(sorted(plan.fields)) or 'none'
+    header = [ 'Plan for %s with tags: %s' % (plan.direction, tags),
+               'Input fields: %s' % fields,
+               '%d rules evaluated as a bulk field mapping' % len(mapping),
+               '%d rules, %d nodes evaluated, ~%d allocations per call, '
+               '%d bytes retained' % (len(plan.steps), total_nodes,
+               total_allocations, total_retained) ]
+    return '\n'.join(header + lines)
@@ -0,0 +1,170 @@
+#
+# This file is part of ArgProc. ArgProc is free software that is made
+# available under the MIT license. Consult the file "LICENSE" that is
+# distributed together with this file for the exact licensing terms.
+#
+# ArgProc is copyright (c) 2010 by the ArgProc authors. See the file
+# "AUTHORS" for a complete overview.
+
+from argproc.error import Error
+from argproc.parser import (Node, Literal, Field, Tuple, Subscription,
+                            Validation)
+from argproc.plan import Step
+from argproc.optimizer import has_checks, strip_validations
+
+
+class Scope(Node):
+    """Evaluate a subtree in a fixed namespace.
+
+    When the subtree replaces a field, `label' is the text of that field, so
+    that errors still refer to the field.
+    """
+
+    def __init__(self, node, namespace, label=None):
+        super(Scope, self).__init__(node)
+        self.namespace = namespace
+        self.label = label
+
+    def eval(self, args, globals):
+        return self[0].eval(args, self.namespace)
+
+    def tostring(self):
+        return self.label or self[0].tostring()
+
+    def show_tree(self):
+        return self[0].show_tree()
+
+
+class Shared(Node):
+    """A subtree that is inlined in several places. It is evaluated once
+    per call if the arguments are a CallArgs."""
+
+    def __init__(self, node):
+        super(Shared, self).__init__(node)
+
+    def eval(self, args, globals):
+        cache = getattr(args, 'cache', None)
+        if cache is None:
+            return self[0].eval(args, globals)
+        try:
+            return cache[id(self)]
+        except KeyError:
+            value = cache[id(self)] = self[0].eval(args, globals)
+            return value
+
+    def tostring(self):
+        return self[0].tostring()
+
+    def show_tree(self):
+        return self[0].show_tree()
+
+
+class CallArgs(object):
+    """The arguments of one call, with a cache for Shared subtrees."""
+
+    def __init__(self, args):
+        self.args = args
+        self.cache = {}
+
+    def __getitem__(self, name):
+        return self.args[name]
+
+    def __contains__(self, name):
+        return name in self.args
+
+
+def _validations(node):
+    """Return the outermost validations in `node'."""
+    if isinstance(node, Validation):
+        return [node]
+    return reduce(list.__add__, (_validations(child) for child in node), [])
+
+
+def fuse(first, second, direction):
+    """Fuse the plans of processors `first' and `second' for `direction'
+    into a list of steps, that gives the same result as processing with
+    `first' and then processing the result with `second'.
+
+    The steps of `first' that can raise an error are evaluated first, for
+    their checks only: their validations and missing fields. The fields
+    referenced by `second' are then replaced by the expressions that `first'
+    assigns to them. An expression that replaces more than one field
+    reference is evaluated once per call, see Shared.
+    """
+    for proc in (first, second):
+        if proc.ignore_none:
+            raise Error('Cannot fuse processors that ignore None values')
+    if first.ignore_missing != second.ignore_missing:
+        raise Error('Cannot fuse processors with different ignore_missing')
+    fplan = first._plan(direction)
+    splan = second._plan(direction)
+    writers = {}
+    for step in fplan.steps:
+        if not step.store:
+            continue
+        for i in range(len(step.outputs)):
+            node = step.outputs[i]
+            writers.setdefault(node.root, []).append((step, i, node))
+    steps = []
+    checked = set()
+    for step in fplan.steps:
+        if not has_checks(step, first.ignore_missing):
+            continue
+        checks = Tuple(_validations(step.ispec) + step.inputs)
+        ispec = Scope(checks, first.namespace, step.ispec.tostring())
+        check = Step(step.rule, direction, ispec, step.ospec)
+        check.store = False
+        steps.append(check)
+        checked.add(step)
+    references = {}
+    for step in splan.steps:
+        for node in step.inputs:
+            references[node.root] = references.get(node.root, 0) + 1
+    expressions = {}
+    def expression(wstep):
+        # The expression of `wstep', shared by all fields that it assigns.
+        if wstep not in expressions:
+            expr = wstep.ispec
+            if wstep in checked:
+                # Validated already by the check step.
+                expr = strip_validations(expr)
+            uses = sum(references.get(node.root, 0)
+                       for node in wstep.outputs)
+            if uses > 1 and not isinstance(expr, (Field, Literal)):
+                expr = Shared(expr)
+            expressions[wstep] = expr
+        return expressions[wstep]
+    for step in splan.steps:
+        unproduced = [ node.name for node in step.inputs
+                       if node.root not in writers ]
+        if unproduced:
+            # This step never has its input, so it is either never
+            # evaluated, or always fails.
+            if step.rule.mandatory and not second.ignore_missing:
+                m = 'Cannot fuse: rule "%s" needs fields that are never ' \
+                    'assigned: %s' % (step.rule.tostring(),
+                                      ', '.join(unproduced))
+                raise Error(m, fields=unproduced, rule=step.rule)
+            continue
+        aliases = {}
+        def substitute(node):
+            if not isinstance(node, Field):
+                return
+            entries = writers[node.root]
+            wstep, index, wnode = entries[0]
+            if len(entries) > 1 or wnode.name != node.name:
+                m = 'Cannot fuse: field "%s" is not assigned by exactly ' \
+                    'one rule' % node.name
+                raise Error(m, fields=[node.name], rule=step.rule)
+            expr = expression(wstep)
+            if len(wstep.outputs) > 1:
+                expr = Subscription(expr, Literal(index))
+            for field in wstep.inputs:
+                aliases.setdefault(field.name, node.name)
+            return Scope(expr, first.namespace, node.tostring())
+        ispec = step.ispec.transform(substitute)
+        fused = Step(step.rule, direction, ispec, step.ospec)
+        fused.store = step.store
+        fused.aliases = aliases
+        steps.append(fused)
+    return steps
@@ -0,0 +1,137 @@
+#
+# This file is part of ArgProc. ArgProc is free software that is made
+# available under the MIT license. Consult the file "LICENSE" that is
+# distributed together with this file for the exact licensing terms.
+#
+# ArgProc is copyright (c) 2010 by the ArgProc authors. See the file
+# "AUTHORS" for a complete overview.
+
+import os
+import re
+import hashlib
+import threading
+
+from argproc.error import Error
+from argproc.parser import RuleParser
+
+# An include directive is a comment, so that the parser ignores it.
+_re_include = re.compile(r'^#include[ \t]+"?([^"\s]+)"?[ \t]*$', re.M)
+
+
+class RuleLoader(object):
+    """Load rules from a set of files.
+
+    A file can include another file with a line `#include <file>'. The file
+    name is relative to the directory of the including file. The rules of
+    an included file come before the rules of the file that includes it,
+    and every file is included only once. The order of the rules therefore
+    only depends on the files, not on the order in which they are parsed.
+
+    Files are read, hashed and parsed independently by up to `workers'
+    threads, one level of includes at a time. The parsed rules are cached by
+    the hash of the contents of the file, so that loading the files again
+    only parses the files that changed.
+    """
+
+    def __init__(self, workers=4):
+        self.workers = workers
+        self.files = []
+        self._cache = {}
+        self._local = threading.local()
+
+    def _read(self, fname):
+        """INTERNAL: return the contents of `fname'."""
+        fin = file(fname)
+        try:
+            return fin.read()
+        finally:
+            fin.close()
+
+    def _load(self, fname):
+        """INTERNAL: read, hash and parse `fname'. Return a tuple (digest,
+        includes, error, rules). Only one of `error' and `rules' is set."""
+        try:
+            contents = self._read(fname)
+        except Exception, e:
+            return None, [], e, None
+        digest = hashlib.sha1(contents).hexdigest()
+        dirname = os.path.dirname(fname)
+        includes = [ os.path.join(dirname, name)
+                     for name in _re_include.findall(contents) ]
+        rules = self._cache.get(digest)
+        if rules is not None:
+            return digest, includes, None, rules
+        parser = getattr(self._local, 'parser', None)
+        if parser is None:
+            parser = self._local.parser = RuleParser()
+        try:
+            rules = tuple(parser.parse(contents, fname))
+        except Exception, e:
+            return digest, includes, e, None
+        return digest, includes, None, rules
+
+    def _order(self, fnames, loaded):
+        """INTERNAL: return the files in `loaded' in rule order. Raise the
+        first error in rule order."""
+        order = []
+        seen = set()
+        def visit(fname, stack):
+            key = os.path.abspath(fname)
+            if key in stack:
+                cycle = stack[stack.index(key):] + [key]
+                m = 'Include cycle: %s' % ' -> '.join(cycle)
+                raise Error(m)
+            if key in seen:
+                return
+            seen.add(key)
+            digest, includes, error, rules = loaded[key]
+            if error is not None:
+                raise error
+            for include in includes:
+                visit(include, stack + [key])
+            order.append(fname)
+        for fname in fnames:
+            visit(fname, [])
+        return order
+
+    def load(self, fnames):
+        """Load the rules in the files `fnames'. Return a list of rules.
+        Afterwards, `files' is the list of files that were loaded."""
+        loaded = {}
+        pool = None
+        try:
+            pending = list(fnames)
+            while pending:
+                if self.workers > 1 and len(pending) > 1:
+                    if pool is None:
+                        from multiprocessing.pool import ThreadPool
+                        pool = ThreadPool(self.workers)
+                    results = pool.map(self._load, pending)
+                else:
+                    results = map(self._load, pending)
+                for fname, result in zip(pending, results):
+                    loaded[os.path.abspath(fname)] = result
+                included = []
+                queued = set()
+                for fname, result in zip(pending, results):
+                    for include in result[1]:
+                        key = os.path.abspath(include)
+                        if key not in loaded and key not in queued:
+                            queued.add(key)
+                            included.append(include)
+                pending = included
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+        order = self._order(fnames, loaded)
+        rules = []
+        cache = {}
+        for fname in order:
+            digest, includes, error, parsed = loaded[os.path.abspath(fname)]
+            rules += parsed
+            cache[digest] = parsed
+        # Only keep the files that are currently in use.
+        self._cache = cache
+        self.files = order
+        return rules
@@ -0,0 +1,96 @@
+#
+# This file is part of ArgProc. ArgProc is free software that is made
+# available under the MIT license. Consult the file "LICENSE" that is
+# distributed together with this file for the exact licensing terms.
+#
+# ArgProc is copyright (c) 2010 by the ArgProc authors. See the file
+# "AUTHORS" for a complete overview.
+
+import warnings
+
+from argproc.error import RuleWarning
+from argproc.parser import Validation
+
+
+def _strip_validation(node):
+    """Transform function that replaces validations by their field."""
+    if isinstance(node, Validation):
+        return node[0]
+
+
+def strip_validations(node):
+    """Return a copy of the tree `node' in which every validation is replaced
+    by the field that it validates."""
+    return node.transform(_strip_validation)
+
+
+def has_checks(step, ignore_missing):
+    """Return whether evaluating `step' can raise an error, other than through
+    a failing function call."""
+    if step.rule.mandatory and not ignore_missing:
+        return True
+    for node in step.ispec.walk():
+        if isinstance(node, Validation):
+            return True
+    return False
+
+
+def _always_stores(step, ignore_none, ignore_missing):
+    """Return whether `step' assigns its outputs on every call that does not
+    raise an error."""
+    if not step.store or ignore_none:
+        return False
+    if not step.inputs:
+        return True
+    return step.rule.mandatory and not ignore_missing
+
+
+def _covered(node, assigned):
+    """Return whether output `node' is overwritten by the fields in
+    `assigned'."""
+    return node.name in assigned or node.root in assigned
+
+
+def optimize(steps, ignore_none=False, ignore_missing=False):
+    """Optimize the steps of a plan for one direction and set of tags.
+
+    Duplicate steps are removed. Steps whose outputs are always overwritten
+    by later steps are removed too, or evaluated for their checks only if
+    they contain validations or mandatory fields. A RuleWarning is issued
+    for output fields that are still assigned by more than one step.
+    """
+    # Keep the last of each set of duplicates: it is the one that
+    # determines the output if another step assigns the same field in
+    # between.
+    seen = set()
+    unique = []
+    for step in reversed(steps):
+        key = step.key()
+        if key in seen:
+            continue
+        seen.add(key)
+        unique.append(step)
+    assigned = set()
+    result = []
+    for step in unique:
+        if all(_covered(node, assigned) for node in step.outputs):
+            if not has_checks(step, ignore_missing):
+                continue
+            step.store = False
+        elif _always_stores(step, ignore_none, ignore_missing):
+            assigned.update(node.name for node in step.outputs)
+        result.append(step)
+    result.reverse()
+    writers = {}
+    for step in result:
+        if not step.store:
+            continue
+        for node in step.outputs:
+            writers.setdefault(node.name, []).append(step)
+    for field in sorted(writers):
+        if len(writers[field]) < 2:
+            continue
+        rules = '; '.join(step.rule.tostring() for step in writers[field])
+        m = 'Field "%s" is assigned by multiple rules: %s' % (field, rules)
+        warnings.warn(m, RuleWarning)
+    return result
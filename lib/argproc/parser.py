@@ -6,8 +6,12 @@
 # ArgProc is copyright (c) 2010 by the ArgProc authors. See the file
 # "AUTHORS" for a complete overview.
 
+import re
 import sys
 import os.path
+import operator
+import copy
+import weakref
 
 from argproc.error import *
 from argproc.plyparse import Parser
@@ -17,10 +21,8 @@ class Rule(object):
 
     def __init__(self, left, direction, right, mandatory, tags):
         self.left = left
-        self.left.side = 'left'
         self.direction = direction
         self.right = right
-        self.right.side = 'right'
         self.mandatory = mandatory
         self.tags = tags
 
@@ -39,7 +41,11 @@ class Rule(object):
 
 
 class Node(object):
-    """A parsed node in our AST."""
+    """A parsed node in our AST.
+
+    Parsed nodes are shared between rules and processors (see _intern), so
+    they must not be modified after they are created.
+    """
 
     def __init__(self, *args):
         children = []
@@ -64,6 +70,30 @@ class Node(object):
     def append(self, el):
         self.children.append(el)
 
+    def walk(self):
+        """Yield this node and (recursively) all its children."""
+        yield self
+        for child in self:
+            for node in child.walk():
+                yield node
+
+    def transform(self, func):
+        """Return a copy of this tree in which every node for which `func'
+        returns a replacement is replaced by it. Subtrees that do not change
+        are shared with the original."""
+        replacement = func(self)
+        if replacement is not None:
+            return replacement
+        children = [ child.transform(func) for child in self ]
+        for old, new in zip(self.children, children):
+            if old is not new:
+                break
+        else:
+            return self
+        node = copy.copy(self)
+        node.children = children
+        return node
+
     def eval(self, args, globals):
         """(Recursively) evaluate the value of this node."""
         raise NotImplementedError
@@ -82,18 +112,26 @@ class Node(object):
     def formatter(format):
         """Return a formatter for this Node."""
         def format_func(self):
-            return format % tuple(map(self, lambda x: x.tostring()))
+            return format % tuple(map(lambda x: x.tostring(), self))
         return format_func
 
+    def assigned_nodes(self):
+        """All Field nodes that are (recursively) assigned by this node."""
+        nodes = (child.assigned_nodes() for child in self)
+        return reduce(list.__add__, nodes, [])
+
+    def referenced_nodes(self):
+        """All Field nodes that are (recursively) referenced by this node."""
+        nodes = (child.referenced_nodes() for child in self)
+        return reduce(list.__add__, nodes, [])
+
     def assigned_fields(self):
         """All fields that are (recursively) assigned by this node."""
-        fields = (child.assigned_fields() for child in self)
-        return reduce(list.__add__, fields, [])
+        return [ node.name for node in self.assigned_nodes() ]
 
     def referenced_fields(self):
         """All fields that are (recursively) referenced by this node."""
-        fields = (child.referenced_fields() for child in self)
-        return reduce(list.__add__, fields, [])
+        return [ node.name for node in self.referenced_nodes() ]
 
     def show_tree(self):
         return '%s(%s)' % (self.__class__.__name__,
@@ -115,6 +153,23 @@ class Literal(Node):
     show_tree = tostring
 
 
+class Regex(Node):
+    """A regular expression literal. It is compiled when it is parsed."""
+
+    def __init__(self, pattern):
+        super(Regex, self).__init__()
+        self.pattern = pattern
+        self.regex = re.compile(pattern)
+
+    def eval(self, args, globals):
+        return self.regex
+
+    def tostring(self):
+        return '/%s/' % self.pattern
+
+    show_tree = tostring
+
+
 class Tuple(Node):
 
     def __init__(self, elements):
@@ -166,33 +221,116 @@ class Name(Node):
     def __init__(self, name):
         super(Name, self).__init__()
         self.name = name
+        self.code = compile(name, '<rule>', 'eval')
 
     def eval(self, args, globals):
-        value = eval(self.name, globals, args)
+        value = eval(self.code, globals, args)
         return value
 
     def tostring(self):
         return self.name
 
+    show_tree = tostring
+
 
 class Field(Node):
 
     def __init__(self, name):
         super(Field, self).__init__()
         self.name = name[1:]
+        self.root = self.name
 
     def eval(self, args, globals):
         return args[self.name]
 
-    def referenced_fields(self):
-        return [self.name]
+    def exists(self, args):
+        """Return whether this field exists in `args'."""
+        return self.name in args
 
-    def assigned_fields(self):
-        return [self.name]
+    def assign(self, target, value):
+        """Assign `value' to this field in `target'."""
+        target[self.name] = value
+
+    def referenced_nodes(self):
+        return [self]
+
+    def assigned_nodes(self):
+        return [self]
 
     def tostring(self):
         return '$%s' % self.name
 
+    show_tree = tostring
+
+
+def _member_getter(name):
+    """Return a function that gets member `name' of a mapping or an
+    object."""
+    def get_member(object):
+        if hasattr(object, 'keys'):
+            return object[name]
+        return getattr(object, name)
+    return get_member
+
+
+def _set_item(container, key, value):
+    """Set `container[key]', growing lists as required."""
+    if isinstance(container, list) and len(container) <= key:
+        container.extend([None] * (key + 1 - len(container)))
+    container[key] = value
+
+
+class FieldPath(Field):
+    """A field with a path into a nested value, e.g. $items[0].sku."""
+
+    re_step = re.compile(r'\.([a-zA-Z_][a-zA-Z0-9_]*)|\[([0-9]+)\]')
+
+    def __init__(self, name):
+        super(FieldPath, self).__init__(name)
+        pos = self.re_step.search(self.name).start()
+        self.root = self.name[:pos]
+        path = [self.root]
+        getters = []
+        for member, index in self.re_step.findall(self.name, pos):
+            if member:
+                path.append(member)
+                getters.append(_member_getter(member))
+            else:
+                path.append(int(index))
+                getters.append(operator.itemgetter(int(index)))
+        self.path = path
+        self._getters = getters
+        # For each container on the path: its key in the parent container,
+        # and the type of the container to create if it does not exist.
+        self._setters = [ (path[i], type(path[i+1]) is int and list or dict)
+                          for i in range(len(path)-1) ]
+
+    def eval(self, args, globals):
+        value = args[self.root]
+        for getter in self._getters:
+            value = getter(value)
+        return value
+
+    def exists(self, args):
+        try:
+            self.eval(args, None)
+        except (KeyError, IndexError, AttributeError, TypeError):
+            return False
+        return True
+
+    def assign(self, target, value):
+        container = target
+        for key, factory in self._setters:
+            try:
+                child = container[key]
+            except (KeyError, IndexError):
+                child = None
+            if child is None:
+                child = factory()
+                _set_item(container, key, child)
+            container = child
+        _set_item(container, self.path[-1], value)
+
 
 class FunctionCall(Node):
 
@@ -226,7 +364,8 @@ class AttributeReference(Node):
         except Exception, e:
             self._eval_error(e)
 
-    tostring = Node.formatter('%s.%s')
+    def tostring(self):
+        return '%s.%s' % (self[0].tostring(), self.attribute)
 
 
 class Subscription(Node):
@@ -264,6 +403,35 @@ class Slicing(Node):
     tostring = Node.formatter('%s[%s:%s]')
 
 
+class Range(Node):
+    """An inclusive range of literals, used as a validator."""
+
+    def __init__(self, low, high):
+        super(Range, self).__init__(low, high)
+
+    tostring = Node.formatter('%s..%s')
+
+
+class Comparison(Node):
+    """A comparison with a literal, used as a validator."""
+
+    def __init__(self, operator, value):
+        super(Comparison, self).__init__(value)
+        self.operator = operator
+
+    def tostring(self):
+        return '%s%s' % (self.operator, self[0].tostring())
+
+
+class TypeCheck(Node):
+    """A type or tuple of types, used as a validator."""
+
+    def __init__(self, types):
+        super(TypeCheck, self).__init__(types)
+
+    tostring = Node.formatter('is %s')
+
+
 class Validation(Node):
 
     def __init__(self, field, validator):
@@ -295,12 +463,110 @@ class Validation(Node):
                                        % self[1].tostring(), fields=[field])
         return value
 
-    def assigned_fields(self):
-        return self[0].assigned_fields()
+    def assigned_nodes(self):
+        return self[0].assigned_nodes()
 
     tostring = Node.formatter('%s:%s')
 
 
+class RegexValidation(Validation):
+    """Validate a field against a regular expression literal."""
+
+    def __init__(self, field, validator):
+        super(RegexValidation, self).__init__(field, validator)
+        self.match = validator.regex.match
+
+    def eval(self, args, globals):
+        value = self[0].eval(args, globals)
+        try:
+            matched = self.match(value)
+        except TypeError:
+            field = self[0].tostring()
+            self._validation_error(field, 'value is not a string',
+                                   fields=[field])
+        if matched is None:
+            field = self[0].tostring()
+            self._validation_error(field, 'value does not match %s' \
+                                   % self[1].tostring(), fields=[field])
+        return value
+
+
+# Groups of types whose values can be compared to each other.
+_comparable_types = ((int, long, float), basestring)
+
+def _comparable(value, bound):
+    """Return whether `value' has a type that can be compared to literal
+    `bound'. Python 2 compares values of any two types, so this is checked
+    explicitly."""
+    if isinstance(value, bool) != isinstance(bound, bool):
+        return False
+    for types in _comparable_types:
+        if isinstance(bound, types):
+            return isinstance(value, types)
+    return type(value) is type(bound)
+
+
+class RangeValidation(Validation):
+    """Validate that a field is within a range."""
+
+    def __init__(self, field, validator):
+        super(RangeValidation, self).__init__(field, validator)
+        self.low = validator[0].value
+        self.high = validator[1].value
+
+    def eval(self, args, globals):
+        value = self[0].eval(args, globals)
+        valid = _comparable(value, self.low) and \
+                _comparable(value, self.high) and \
+                self.low <= value <= self.high
+        if not valid:
+            field = self[0].tostring()
+            self._validation_error(field, 'value not in range %s' \
+                                   % self[1].tostring(), fields=[field])
+        return value
+
+
+class ComparisonValidation(Validation):
+    """Validate a field by comparing it to a literal."""
+
+    def __init__(self, field, validator):
+        super(ComparisonValidation, self).__init__(field, validator)
+        self.operator = validator.operator
+        self.bound = validator[0].value
+
+    def eval(self, args, globals):
+        value = self[0].eval(args, globals)
+        operator = self.operator
+        if not _comparable(value, self.bound):
+            valid = False
+        elif operator == '>=':
+            valid = value >= self.bound
+        elif operator == '>':
+            valid = value > self.bound
+        elif operator == '<=':
+            valid = value <= self.bound
+        else:
+            valid = value < self.bound
+        if not valid:
+            field = self[0].tostring()
+            self._validation_error(field, 'value not %s' \
+                                   % self[1].tostring(), fields=[field])
+        return value
+
+
+class TypeValidation(Validation):
+    """Validate the type of a field."""
+
+    def eval(self, args, globals):
+        value = self[0].eval(args, globals)
+        types = self[1][0].eval(args, globals)
+        if not isinstance(value, types):
+            field = self[0].tostring()
+            self._validation_error(field, 'value is not an instance of %s' \
+                                   % self[1][0].tostring(), fields=[field])
+        return value
+
+
 class Tag(object):
 
     def __init__(self, name, negated):
@@ -315,31 +581,55 @@ class Tag(object):
         return s
 
 
+# Parsed nodes by type and string representation.
+_nodes = weakref.WeakValueDictionary()
+
+def _intern(node):
+    """Return the parsed node that is equal to `node', or `node' itself
+    if there is none. Nodes are equal if they have the same type and string
+    representation."""
+    key = (type(node), node.tostring())
+    shared = _nodes.get(key)
+    if shared is None:
+        _nodes[key] = shared = node
+    return shared
+
+
 class RuleParser(Parser):
     """A parser for our validation rule syntax."""
 
     exception = ParseError
 
     tokens = ('NAME', 'FIELD', 'ARROW', 'LARROW', 'RARROW', 'INTEGER',
-              'FLOAT', 'STRING', 'TRUE', 'FALSE', 'NONE')
-    literals = ('(', ')', '[', ']', ',', ':', '*', '!', '{', '}', '.', '@')
-
-    t_NAME = '[a-zA-Z_][a-zA-Z0-9_]*'
-    t_FIELD = r'\$!?[a-zA-Z_][a-zA-Z0-9_]*'
+              'FLOAT', 'STRING', 'REGEX', 'TRUE', 'FALSE', 'NONE', 'IS',
+              'DOTDOT', 'GE')
+    literals = ('(', ')', '[', ']', ',', ':', '*', '!', '{', '}', '.', '@',
+                '<', '>')
+    reserved = { 'True': 'TRUE', 'False': 'FALSE', 'None': 'NONE',
+                 'is': 'IS' }
+
+    # A member that is followed by '(' is a method call, not a path step.
+    t_FIELD = r'\$!?[a-zA-Z_][a-zA-Z0-9_]*' \
+              r'(?:\.[a-zA-Z_][a-zA-Z0-9_]*\b(?![ \t]*\()|\[[0-9]+\])*'
     t_INTEGER = '-?[0-9]+'
     t_FLOAT = r'-?[0-9]+\.[0-9]+'
     t_STRING = '\'[^\']+\'|"[^"]+"'
+    t_REGEX = r'/(?:[^/\\\n]|\\.)+/'
     t_ARROW = '<=>'
     t_LARROW = '<='
     t_RARROW = '=>'
-    t_TRUE = 'True'
-    t_FALSE = 'False'
-    t_NONE = 'None'
+    t_DOTDOT = r'\.\.'
+    t_GE = '>='
     t_ignore = ' \t\n'
 
     def t_COMMENT(self, t):
         r'\#.*'
         pass
+
+    def t_NAME(self, t):
+        '[a-zA-Z_][a-zA-Z0-9_]*'
+        t.type = self.reserved.get(t.value, 'NAME')
+        return t
  
     def p_main(self, p):
         """main : rule
@@ -371,8 +661,9 @@ class RuleParser(Parser):
                       | subscription
                       | slicing
                       | validation
+                      | regex
         """
-        p[0] = p[1]
+        p[0] = _intern(p[1])
 
     def p_literal(self, p):
         """literal : INTEGER
@@ -382,7 +673,16 @@ class RuleParser(Parser):
                    | FALSE
                    | NONE
         """
-        p[0] = Literal(eval(p[1]))
+        p[0] = _intern(Literal(eval(p[1])))
+
+    def p_regex(self, p):
+        """regex : REGEX"""
+        pattern = p[1][1:-1]
+        try:
+            p[0] = Regex(pattern)
+        except re.error, e:
+            m = 'invalid regular expression /%s/: %s' % (pattern, e)
+            self._raise_error(m, p.slice[1])
 
     def p_tuple(self, p):
         """tuple : '(' argument_list ')'
@@ -427,7 +727,10 @@ class RuleParser(Parser):
 
     def p_field(self, p):
         """field : FIELD"""
-        p[0] = Field(p[1])
+        if '.' in p[1] or '[' in p[1]:
+            p[0] = _intern(FieldPath(p[1]))
+        else:
+            p[0] = _intern(Field(p[1]))
 
     def p_function_call(self, p):
         """function_call : expression '(' ')'
@@ -450,8 +753,35 @@ class RuleParser(Parser):
         p[0] = Slicing(p[1], p[3], p[5])
 
     def p_validation(self, p):
-        """validation : field ':' expression"""
-        p[0] = Validation(p[1], p[3])
+        """validation : field ':' expression
+                      | field ':' check
+        """
+        if isinstance(p[3], Regex):
+            p[0] = RegexValidation(p[1], p[3])
+        elif isinstance(p[3], Range):
+            p[0] = RangeValidation(p[1], p[3])
+        elif isinstance(p[3], Comparison):
+            p[0] = ComparisonValidation(p[1], p[3])
+        elif isinstance(p[3], TypeCheck):
+            p[0] = TypeValidation(p[1], p[3])
+        else:
+            p[0] = Validation(p[1], p[3])
+
+    def p_check(self, p):
+        """check : literal DOTDOT literal
+                 | GE literal
+                 | '>' literal
+                 | LARROW literal
+                 | '<' literal
+                 | IS expression
+        """
+        if len(p) == 4:
+            node = Range(p[1], p[3])
+        elif p[1] == 'is':
+            node = TypeCheck(p[2])
+        else:
+            node = Comparison(p[1], p[2])
+        p[0] = _intern(node)
 
     def p_direction(self, p):
         """direction : ARROW
@@ -5,9 +5,9 @@ _tabversion = '3.2'
 
 _lr_method = 'LALR'
 
-_lr_signature = '\xf7\xaa\xd4[&\x97\x1ba\x06\x85r~K\xceN\xa1'
+_lr_signature = '\x05B`\x14\x07b\x041?\xea\x7fM\xb6\xc9\x8e}'
     
-_lr_action_items = {'.':([1,2,3,4,6,7,8,9,10,11,13,14,15,17,18,19,20,21,24,25,27,44,46,47,49,52,58,60,61,62,63,65,70,72,76,77,],[-31,-11,-19,-21,-6,-10,-5,-8,-12,-16,-18,-14,-32,-13,-20,-9,-17,-7,-15,39,39,-22,39,-26,-27,39,-33,-35,39,-23,39,39,-34,-36,39,-37,]),'TRUE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,28,29,34,35,36,37,38,40,41,42,43,44,45,46,47,48,49,50,51,52,54,55,56,57,58,60,62,66,68,70,71,72,73,74,75,77,],[3,-31,-11,-19,-21,3,-6,-10,-5,-8,-12,-16,3,-18,-14,-32,3,-13,-20,-9,-17,-7,-1,3,-15,-44,3,-2,3,-44,3,-42,-41,-40,-39,3,-43,-22,3,-38,-26,3,-27,3,3,-44,-3,-47,-45,-46,-33,-35,-23,-44,-49,-34,3,-36,-4,-50,-48,-37,]),'!':([53,],[67,]),'NONE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,28,29,34,35,36,37,38,40,41,42,43,44,45,46,47,48,49,50,51,52,54,55,56,57,58,60,62,66,68,70,71,72,73,74,75,77,],[4,-31,-11,-19,-21,4,-6,-10,-5,-8,-12,-16,4,-18,-14,-32,4,-13,-20,-9,-17,-7,-1,4,-15,-44,4,-2,4,-44,4,-42,-41,-40,-39,4,-43,-22,4,-38,-26,4,-27,4,4,-44,-3,-47,-45,-46,-33,-35,-23,-44,-49,-34,4,-36,-4,-50,-48,-37,]),')':([1,2,3,4,6,7,8,9,10,11,13,14,15,17,18,19,20,21,24,26,27,36,44,45,46,47,49,58,59,60,62,63,70,72,77,],[-31,-11,-19,-21,-6,-10,-5,-8,-12,-16,-18,-14,-32,-13,-20,-9,-17,-7,-15,44,-24,58,-22,62,-38,-26,-27,-33,70,-35,-23,-25,-34,-36,-37,]),'(':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,27,28,29,34,35,36,37,38,40,41,42,43,44,45,46,47,48,49,51,52,54,55,56,57,58,60,61,62,63,65,66,68,70,71,72,73,74,75,76,77,],[5,-31,-11,-19,-21,5,-6,-10,-5,-8,-12,-16,5,-18,-14,-32,5,-13,-20,-9,-17,-7,-1,-15,36,36,5,-2,5,-44,5,-42,-41,-40,-39,5,-43,-22,5,36,-26,5,-27,5,36,-3,-47,-45,-46,-33,-35,36,-23,36,36,-44,-49,-34,5,-36,-4,-50,-48,36,-37,]),'*':([1,2,3,4,6,7,8,9,10,11,13,14,15,17,18,19,20,21,24,25,44,46,47,49,52,58,60,62,70,72,77,],[-31,-11,-19,-21,-6,-10,-5,-8,-12,-16,-18,-14,-32,-13,-20,-9,-17,-7,-15,37,-22,-38,-26,-27,37,-33,-35,-23,-34,-36,-37,]),',':([1,2,3,4,6,7,8,9,10,11,13,14,15,17,18,19,20,21,24,26,27,30,31,32,44,46,47,49,55,56,58,59,60,62,63,64,65,68,70,72,74,75,77,],[-31,-11,-19,-21,-6,-10,-5,-8,-12,-16,-18,-14,-32,-13,-20,-9,-17,-7,-15,45,-24,48,-28,50,-22,-38,-26,-27,-47,69,-33,48,-35,-23,-25,-29,-30,-49,-34,-36,-50,-48,-37,]),'RARROW':([1,2,3,4,6,7,8,9,10,11,13,14,15,17,18,19,20,21,24,25,44,46,47,49,58,60,62,70,72,77,],[-31,-11,-19,-21,-6,-10,-5,-8,-12,-16,-18,-14,-32,-13,-20,-9,-17,-7,-15,38,-22,-38,-26,-27,-33,-35,-23,-34,-36,-37,]),'LARROW':([1,2,3,4,6,7,8,9,10,11,13,14,15,17,18,19,20,21,24,25,44,46,47,49,58,60,62,70,72,77,],[-31,-11,-19,-21,-6,-10,-5,-8,-12,-16,-18,-14,-32,-13,-20,-9,-17,-7,-15,40,-22,-38,-26,-27,-33,-35,-23,-34,-36,-37,]),'INTEGER':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,28,29,34,35,36,37,38,40,41,42,43,44,45,46,47,48,49,50,51,52,54,55,56,57,58,60,62,66,68,70,71,72,73,74,75,77,],[11,-31,-11,-19,-21,11,-6,-10,-5,-8,-12,-16,11,-18,-14,-32,11,-13,-20,-9,-17,-7,-1,11,-15,-44,11,-2,11,-44,11,-42,-41,-40,-39,11,-43,-22,11,-38,-26,11,-27,11,11,-44,-3,-47,-45,-46,-33,-35,-23,-44,-49,-34,11,-36,-4,-50,-48,-37,]),':':([1,2,3,4,6,7,8,9,10,11,13,14,15,17,18,19,20,21,24,33,44,46,47,49,58,60,61,62,70,72,77,],[-31,-11,-19,-21,-6,28,-5,-8,-12,-16,-18,-14,-32,-13,-20,-9,-17,-7,-15,51,-22,-38,-26,-27,-33,-35,71,-23,-34,-36,-37,]),'$end':([1,2,3,4,6,7,8,9,10,11,12,13,14,15,17,18,19,20,21,22,24,25,29,35,37,43,44,46,47,49,52,54,55,56,57,58,60,62,66,68,70,72,73,74,75,77,],[-31,-11,-19,-21,-6,-10,-5,-8,-12,-16,0,-18,-14,-32,-13,-20,-9,-17,-7,-1,-15,-44,-2,-44,-42,-43,-22,-38,-26,-27,-44,-3,-47,-45,-46,-33,-35,-23,-44,-49,-34,-36,-4,-50,-48,-37,]),'@':([1,2,3,4,6,7,8,9,10,11,13,14,15,17,18,19,20,21,24,25,35,37,43,44,46,47,49,52,58,60,62,66,69,70,72,77,],[-31,-11,-19,-21,-6,-10,-5,-8,-12,-16,-18,-14,-32,-13,-20,-9,-17,-7,-15,-44,53,-42,-43,-22,-38,-26,-27,-44,-33,-35,-23,53,53,-34,-36,-37,]),'STRING':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,28,29,34,35,36,37,38,40,41,42,43,44,45,46,47,48,49,50,51,52,54,55,56,57,58,60,62,66,68,70,71,72,73,74,75,77,],[13,-31,-11,-19,-21,13,-6,-10,-5,-8,-12,-16,13,-18,-14,-32,13,-13,-20,-9,-17,-7,-1,13,-15,-44,13,-2,13,-44,13,-42,-41,-40,-39,13,-43,-22,13,-38,-26,13,-27,13,13,-44,-3,-47,-45,-46,-33,-35,-23,-44,-49,-34,13,-36,-4,-50,-48,-37,]),'FIELD':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,28,29,34,35,36,37,38,40,41,42,43,44,45,46,47,48,49,51,52,54,55,56,57,58,60,62,66,68,70,71,72,73,74,75,77,],[15,-31,-11,-19,-21,15,-6,-10,-5,-8,-12,-16,15,-18,-14,-32,15,-13,-20,-9,-17,-7,-1,-15,-44,15,-2,15,-44,15,-42,-41,-40,-39,15,-43,-22,15,-38,-26,15,-27,15,-44,-3,-47,-45,-46,-33,-35,-23,-44,-49,-34,15,-36,-4,-50,-48,-37,]),'ARROW':([1,2,3,4,6,7,8,9,10,11,13,14,15,17,18,19,20,21,24,25,44,46,47,49,58,60,62,70,72,77,],[-31,-11,-19,-21,-6,-10,-5,-8,-12,-16,-18,-14,-32,-13,-20,-9,-17,-7,-15,41,-22,-38,-26,-27,-33,-35,-23,-34,-36,-37,]),'[':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,27,28,29,34,35,36,37,38,40,41,42,43,44,45,46,47,48,49,51,52,54,55,56,57,58,60,61,62,63,65,66,68,70,71,72,73,74,75,76,77,],[16,-31,-11,-19,-21,16,-6,-10,-5,-8,-12,-16,16,-18,-14,-32,16,-13,-20,-9,-17,-7,-1,-15,42,42,16,-2,16,-44,16,-42,-41,-40,-39,16,-43,-22,16,42,-26,16,-27,16,42,-3,-47,-45,-46,-33,-35,42,-23,42,42,-44,-49,-34,16,-36,-4,-50,-48,42,-37,]),']':([1,2,3,4,6,7,8,9,10,11,13,14,15,17,18,19,20,21,24,27,30,44,46,47,49,58,60,61,62,63,70,72,76,77,],[-31,-11,-19,-21,-6,-10,-5,-8,-12,-16,-18,-14,-32,-13,-20,-9,-17,-7,-15,-24,47,-22,-38,-26,-27,-33,-35,72,-23,-25,-34,-36,77,-37,]),'FALSE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,28,29,34,35,36,37,38,40,41,42,43,44,45,46,47,48,49,50,51,52,54,55,56,57,58,60,62,66,68,70,71,72,73,74,75,77,],[18,-31,-11,-19,-21,18,-6,-10,-5,-8,-12,-16,18,-18,-14,-32,18,-13,-20,-9,-17,-7,-1,18,-15,-44,18,-2,18,-44,18,-42,-41,-40,-39,18,-43,-22,18,-38,-26,18,-27,18,18,-44,-3,-47,-45,-46,-33,-35,-23,-44,-49,-34,18,-36,-4,-50,-48,-37,]),'NAME':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,28,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,51,52,53,54,55,56,57,58,60,62,66,67,68,70,71,72,73,74,75,77,],[1,-31,-11,-19,-21,1,-6,-10,-5,-8,-12,-16,1,-18,-14,-32,1,-13,-20,-9,-17,-7,-1,-15,-44,1,-2,1,-44,1,-42,-41,60,-40,-39,1,-43,-22,1,-38,-26,1,-27,1,-44,68,-3,-47,-45,-46,-33,-35,-23,-44,74,-49,-34,1,-36,-4,-50,-48,-37,]),'FLOAT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,28,29,34,35,36,37,38,40,41,42,43,44,45,46,47,48,49,50,51,52,54,55,56,57,58,60,62,66,68,70,71,72,73,74,75,77,],[20,-31,-11,-19,-21,20,-6,-10,-5,-8,-12,-16,20,-18,-14,-32,20,-13,-20,-9,-17,-7,-1,20,-15,-44,20,-2,20,-44,20,-42,-41,-40,-39,20,-43,-22,20,-38,-26,20,-27,20,20,-44,-3,-47,-45,-46,-33,-35,-23,-44,-49,-34,20,-36,-4,-50,-48,-37,]),'{':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,28,29,34,35,36,37,38,40,41,42,43,44,45,46,47,48,49,51,52,54,55,56,57,58,60,62,66,68,70,71,72,73,74,75,77,],[23,-31,-11,-19,-21,23,-6,-10,-5,-8,-12,-16,23,-18,-14,-32,23,-13,-20,-9,-17,-7,-1,-15,-44,23,-2,23,-44,23,-42,-41,-40,-39,23,-43,-22,23,-38,-26,23,-27,23,-44,-3,-47,-45,-46,-33,-35,-23,-44,-49,-34,23,-36,-4,-50,-48,-37,]),'}':([1,2,3,4,6,7,8,9,10,11,13,14,15,17,18,19,20,21,24,31,32,44,46,47,49,58,60,62,64,65,70,72,77,],[-31,-11,-19,-21,-6,-10,-5,-8,-12,-16,-18,-14,-32,-13,-20,-9,-17,-7,-15,-28,49,-22,-38,-26,-27,-33,-35,-23,-29,-30,-34,-36,-37,]),}
+_lr_action_items = {'.':([1,2,3,4,5,7,8,9,10,11,12,14,15,16,17,19,20,21,22,23,26,27,29,46,48,50,55,56,58,61,67,69,70,71,72,73,75,76,77,78,80,85,87,88,92,93,],[-33,-11,-20,-16,-22,-6,-10,-5,-8,-12,-17,-23,-19,-14,-34,-13,-21,-9,-18,-7,-15,41,41,-24,-41,-5,41,-28,-29,41,-35,-37,41,-25,41,-45,-46,-44,41,-43,41,-36,-38,-42,41,-39,]),'TRUE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,30,31,36,37,38,39,40,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,64,65,66,67,69,71,73,74,75,76,77,78,81,83,85,86,87,88,89,90,91,93,],[3,-33,-11,-20,-16,-22,3,-6,-10,-5,-8,-12,-17,3,-23,-19,-14,-34,3,-13,-21,-9,-18,-7,-1,3,-15,-53,3,-2,3,-53,3,-51,-50,-49,-48,3,-52,-24,3,-41,3,-5,3,3,3,3,-40,-28,3,-29,3,3,-53,-3,-56,-54,-55,-35,-37,-25,-45,3,-46,-44,-47,-43,-53,-58,-36,3,-38,-42,-4,-59,-57,-39,]),'!':([62,],[82,]),'NONE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,30,31,36,37,38,39,40,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,64,65,66,67,69,71,73,74,75,76,77,78,81,83,85,86,87,88,89,90,91,93,],[5,-33,-11,-20,-16,-22,5,-6,-10,-5,-8,-12,-17,5,-23,-19,-14,-34,5,-13,-21,-9,-18,-7,-1,5,-15,-53,5,-2,5,-53,5,-51,-50,-49,-48,5,-52,-24,5,-41,5,-5,5,5,5,5,-40,-28,5,-29,5,5,-53,-3,-56,-54,-55,-35,-37,-25,-45,5,-46,-44,-47,-43,-53,-58,-36,5,-38,-42,-4,-59,-57,-39,]),')':([1,2,3,4,5,7,8,9,10,11,12,14,15,16,17,19,20,21,22,23,26,28,29,38,46,47,48,50,55,56,58,67,68,69,71,72,73,75,76,77,78,85,87,88,93,],[-33,-11,-20,-16,-22,-6,-10,-5,-8,-12,-17,-23,-19,-14,-34,-13,-21,-9,-18,-7,-15,46,-26,67,-24,71,-41,-5,-40,-28,-29,-35,85,-37,-25,-27,-45,-46,-44,-47,-43,-36,-38,-42,-39,]),'(':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,26,27,29,30,31,36,37,38,39,40,42,43,44,45,46,47,48,50,53,55,56,57,58,60,61,63,64,65,66,67,69,70,71,72,73,75,76,77,78,80,81,83,85,86,87,88,89,90,91,92,93,],[6,-33,-11,-20,-16,-22,6,-6,-10,-5,-8,-12,-17,6,-23,-19,-14,-34,6,-13,-21,-9,-18,-7,-1,-15,38,38,6,-2,6,-53,6,-51,-50,-49,-48,6,-52,-24,6,-41,-5,6,38,-28,6,-29,6,38,-3,-56,-54,-55,-35,-37,38,-25,38,-45,-46,-44,38,-43,38,-53,-58,-36,6,-38,-42,-4,-59,-57,38,-39,]),'*':([1,2,3,4,5,7,8,9,10,11,12,14,15,16,17,19,20,21,22,23,26,27,46,48,50,55,56,58,61,67,69,71,73,75,76,77,78,85,87,88,93,],[-33,-11,-20,-16,-22,-6,-10,-5,-8,-12,-17,-23,-19,-14,-34,-13,-21,-9,-18,-7,-15,39,-24,-41,-5,-40,-28,-29,39,-35,-37,-25,-45,-46,-44,-47,-43,-36,-38,-42,-39,]),',':([1,2,3,4,5,7,8,9,10,11,12,14,15,16,17,19,20,21,22,23,26,28,29,32,33,34,46,48,50,55,56,58,64,65,67,68,69,71,72,73,75,76,77,78,79,80,83,85,87,88,90,91,93,],[-33,-11,-20,-16,-22,-6,-10,-5,-8,-12,-17,-23,-19,-14,-34,-13,-21,-9,-18,-7,-15,47,-26,57,-30,59,-24,-41,-5,-40,-28,-29,-56,84,-35,57,-37,-25,-27,-45,-46,-44,-47,-43,-31,-32,-58,-36,-38,-42,-59,-57,-39,]),'RARROW':([1,2,3,4,5,7,8,9,10,11,12,14,15,16,17,19,20,21,22,23,26,27,46,48,50,55,56,58,67,69,71,73,75,76,77,78,85,87,88,93,],[-33,-11,-20,-16,-22,-6,-10,-5,-8,-12,-17,-23,-19,-14,-34,-13,-21,-9,-18,-7,-15,40,-24,-41,-5,-40,-28,-29,-35,-37,-25,-45,-46,-44,-47,-43,-36,-38,-42,-39,]),'DOTDOT':([3,5,12,15,20,22,50,],[-20,-22,-17,-19,-21,-18,74,]),'LARROW':([1,2,3,4,5,7,8,9,10,11,12,14,15,16,17,19,20,21,22,23,26,27,30,46,48,50,55,56,58,67,69,71,73,75,76,77,78,85,87,88,93,],[-33,-11,-20,-16,-22,-6,-10,-5,-8,-12,-17,-23,-19,-14,-34,-13,-21,-9,-18,-7,-15,42,49,-24,-41,-5,-40,-28,-29,-35,-37,-25,-45,-46,-44,-47,-43,-36,-38,-42,-39,]),'INTEGER':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,30,31,36,37,38,39,40,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,64,65,66,67,69,71,73,74,75,76,77,78,81,83,85,86,87,88,89,90,91,93,],[12,-33,-11,-20,-16,-22,12,-6,-10,-5,-8,-12,-17,12,-23,-19,-14,-34,12,-13,-21,-9,-18,-7,-1,12,-15,-53,12,-2,12,-53,12,-51,-50,-49,-48,12,-52,-24,12,-41,12,-5,12,12,12,12,-40,-28,12,-29,12,12,-53,-3,-56,-54,-55,-35,-37,-25,-45,12,-46,-44,-47,-43,-53,-58,-36,12,-38,-42,-4,-59,-57,-39,]),':':([1,2,3,4,5,7,8,9,10,11,12,14,15,16,17,19,20,21,22,23,26,35,46,48,50,55,56,58,67,69,70,71,73,75,76,77,78,85,87,88,93,],[-33,-11,-20,-16,-22,-6,30,-5,-8,-12,-17,-23,-19,-14,-34,-13,-21,-9,-18,-7,-15,60,-24,-41,-5,-40,-28,-29,-35,-37,86,-25,-45,-46,-44,-47,-43,-36,-38,-42,-39,]),'<':([30,],[51,]),'$end':([1,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,19,20,21,22,23,24,26,27,31,37,39,45,46,48,50,55,56,58,61,63,64,65,66,67,69,71,73,75,76,77,78,81,83,85,87,88,89,90,91,93,],[-33,-11,-20,-16,-22,-6,-10,-5,-8,-12,-17,0,-23,-19,-14,-34,-13,-21,-9,-18,-7,-1,-15,-53,-2,-53,-51,-52,-24,-41,-5,-40,-28,-29,-53,-3,-56,-54,-55,-35,-37,-25,-45,-46,-44,-47,-43,-53,-58,-36,-38,-42,-4,-59,-57,-39,]),'REGEX':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,26,27,30,31,36,37,38,39,40,42,43,44,45,46,47,48,50,53,55,56,57,58,60,61,63,64,65,66,67,69,71,73,75,76,77,78,81,83,85,86,87,88,89,90,91,93,],[14,-33,-11,-20,-16,-22,14,-6,-10,-5,-8,-12,-17,14,-23,-19,-14,-34,14,-13,-21,-9,-18,-7,-1,-15,-53,14,-2,14,-53,14,-51,-50,-49,-48,14,-52,-24,14,-41,-5,14,-40,-28,14,-29,14,-53,-3,-56,-54,-55,-35,-37,-25,-45,-46,-44,-47,-43,-53,-58,-36,14,-38,-42,-4,-59,-57,-39,]),'@':([1,2,3,4,5,7,8,9,10,11,12,14,15,16,17,19,20,21,22,23,26,27,37,39,45,46,48,50,55,56,58,61,67,69,71,73,75,76,77,78,81,84,85,87,88,93,],[-33,-11,-20,-16,-22,-6,-10,-5,-8,-12,-17,-23,-19,-14,-34,-13,-21,-9,-18,-7,-15,-53,62,-51,-52,-24,-41,-5,-40,-28,-29,-53,-35,-37,-25,-45,-46,-44,-47,-43,62,62,-36,-38,-42,-39,]),'STRING':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,30,31,36,37,38,39,40,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,64,65,66,67,69,71,73,74,75,76,77,78,81,83,85,86,87,88,89,90,91,93,],[15,-33,-11,-20,-16,-22,15,-6,-10,-5,-8,-12,-17,15,-23,-19,-14,-34,15,-13,-21,-9,-18,-7,-1,15,-15,-53,15,-2,15,-53,15,-51,-50,-49,-48,15,-52,-24,15,-41,15,-5,15,15,15,15,-40,-28,15,-29,15,15,-53,-3,-56,-54,-55,-35,-37,-25,-45,15,-46,-44,-47,-43,-53,-58,-36,15,-38,-42,-4,-59,-57,-39,]),'IS':([30,],[53,]),'FIELD':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,26,27,30,31,36,37,38,39,40,42,43,44,45,46,47,48,50,53,55,56,57,58,60,61,63,64,65,66,67,69,71,73,75,76,77,78,81,83,85,86,87,88,89,90,91,93,],[17,-33,-11,-20,-16,-22,17,-6,-10,-5,-8,-12,-17,17,-23,-19,-14,-34,17,-13,-21,-9,-18,-7,-1,-15,-53,17,-2,17,-53,17,-51,-50,-49,-48,17,-52,-24,17,-41,-5,17,-40,-28,17,-29,17,-53,-3,-56,-54,-55,-35,-37,-25,-45,-46,-44,-47,-43,-53,-58,-36,17,-38,-42,-4,-59,-57,-39,]),'GE':([30,],[54,]),'ARROW':([1,2,3,4,5,7,8,9,10,11,12,14,15,16,17,19,20,21,22,23,26,27,46,48,50,55,56,58,67,69,71,73,75,76,77,78,85,87,88,93,],[-33,-11,-20,-16,-22,-6,-10,-5,-8,-12,-17,-23,-19,-14,-34,-13,-21,-9,-18,-7,-15,43,-24,-41,-5,-40,-28,-29,-35,-37,-25,-45,-46,-44,-47,-43,-36,-38,-42,-39,]),'[':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,26,27,29,30,31,36,37,38,39,40,42,43,44,45,46,47,48,50,53,55,56,57,58,60,61,63,64,65,66,67,69,70,71,72,73,75,76,77,78,80,81,83,85,86,87,88,89,90,91,92,93,],[18,-33,-11,-20,-16,-22,18,-6,-10,-5,-8,-12,-17,18,-23,-19,-14,-34,18,-13,-21,-9,-18,-7,-1,-15,44,44,18,-2,18,-53,18,-51,-50,-49,-48,18,-52,-24,18,-41,-5,18,44,-28,18,-29,18,44,-3,-56,-54,-55,-35,-37,44,-25,44,-45,-46,-44,44,-43,44,-53,-58,-36,18,-38,-42,-4,-59,-57,44,-39,]),']':([1,2,3,4,5,7,8,9,10,11,12,14,15,16,17,19,20,21,22,23,26,29,32,46,48,50,55,56,58,67,69,70,71,72,73,75,76,77,78,85,87,88,92,93,],[-33,-11,-20,-16,-22,-6,-10,-5,-8,-12,-17,-23,-19,-14,-34,-13,-21,-9,-18,-7,-15,-26,56,-24,-41,-5,-40,-28,-29,-35,-37,87,-25,-27,-45,-46,-44,-47,-43,-36,-38,-42,93,-39,]),'FALSE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,30,31,36,37,38,39,40,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,64,65,66,67,69,71,73,74,75,76,77,78,81,83,85,86,87,88,89,90,91,93,],[20,-33,-11,-20,-16,-22,20,-6,-10,-5,-8,-12,-17,20,-23,-19,-14,-34,20,-13,-21,-9,-18,-7,-1,20,-15,-53,20,-2,20,-53,20,-51,-50,-49,-48,20,-52,-24,20,-41,20,-5,20,20,20,20,-40,-28,20,-29,20,20,-53,-3,-56,-54,-55,-35,-37,-25,-45,20,-46,-44,-47,-43,-53,-58,-36,20,-38,-42,-4,-59,-57,-39,]),'NAME':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,26,27,30,31,36,37,38,39,40,41,42,43,44,45,46,47,48,50,53,55,56,57,58,60,61,62,63,64,65,66,67,69,71,73,75,76,77,78,81,82,83,85,86,87,88,89,90,91,93,],[1,-33,-11,-20,-16,-22,1,-6,-10,-5,-8,-12,-17,1,-23,-19,-14,-34,1,-13,-21,-9,-18,-7,-1,-15,-53,1,-2,1,-53,1,-51,-50,69,-49,-48,1,-52,-24,1,-41,-5,1,-40,-28,1,-29,1,-53,83,-3,-56,-54,-55,-35,-37,-25,-45,-46,-44,-47,-43,-53,90,-58,-36,1,-38,-42,-4,-59,-57,-39,]),'FLOAT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,30,31,36,37,38,39,40,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,64,65,66,67,69,71,73,74,75,76,77,78,81,83,85,86,87,88,89,90,91,93,],[22,-33,-11,-20,-16,-22,22,-6,-10,-5,-8,-12,-17,22,-23,-19,-14,-34,22,-13,-21,-9,-18,-7,-1,22,-15,-53,22,-2,22,-53,22,-51,-50,-49,-48,22,-52,-24,22,-41,22,-5,22,22,22,22,-40,-28,22,-29,22,22,-53,-3,-56,-54,-55,-35,-37,-25,-45,22,-46,-44,-47,-43,-53,-58,-36,22,-38,-42,-4,-59,-57,-39,]),'{':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,26,27,30,31,36,37,38,39,40,42,43,44,45,46,47,48,50,53,55,56,57,58,60,61,63,64,65,66,67,69,71,73,75,76,77,78,81,83,85,86,87,88,89,90,91,93,],[25,-33,-11,-20,-16,-22,25,-6,-10,-5,-8,-12,-17,25,-23,-19,-14,-34,25,-13,-21,-9,-18,-7,-1,-15,-53,25,-2,25,-53,25,-51,-50,-49,-48,25,-52,-24,25,-41,-5,25,-40,-28,25,-29,25,-53,-3,-56,-54,-55,-35,-37,-25,-45,-46,-44,-47,-43,-53,-58,-36,25,-38,-42,-4,-59,-57,-39,]),'>':([30,],[52,]),'}':([1,2,3,4,5,7,8,9,10,11,12,14,15,16,17,19,20,21,22,23,26,33,34,46,48,50,55,56,58,67,69,71,73,75,76,77,78,79,80,85,87,88,93,],[-33,-11,-20,-16,-22,-6,-10,-5,-8,-12,-17,-23,-19,-14,-34,-13,-21,-9,-18,-7,-15,-30,58,-24,-41,-5,-40,-28,-29,-35,-37,-25,-45,-46,-44,-47,-43,-31,-32,-36,-38,-42,-39,]),}
 
 _lr_action = { }
 for _k, _v in _lr_action_items.items():
@@ -16,7 +16,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'mandatory':([25,52,],[35,66,]),'list':([0,5,12,16,28,34,36,42,45,48,51,71,],[21,21,21,21,21,21,21,21,21,21,21,21,]),'direction':([25,],[34,]),'function_call':([0,5,12,16,28,34,36,42,45,48,51,71,],[2,2,2,2,2,2,2,2,2,2,2,2,]),'tag':([35,66,69,],[55,55,75,]),'tags':([35,66,],[54,73,]),'field':([0,5,12,16,28,34,36,42,45,48,51,71,],[7,7,7,7,7,7,7,7,7,7,7,7,]),'literal':([0,5,12,16,23,28,34,36,42,45,48,50,51,71,],[8,8,8,8,33,8,8,8,8,8,8,33,8,8,]),'dict':([0,5,12,16,28,34,36,42,45,48,51,71,],[9,9,9,9,9,9,9,9,9,9,9,9,]),'argument_list':([5,16,36,],[26,30,59,]),'main':([0,],[12,]),'empty':([25,35,52,66,],[43,57,43,57,]),'attribute_reference':([0,5,12,16,28,34,36,42,45,48,51,71,],[10,10,10,10,10,10,10,10,10,10,10,10,]),'key_value':([23,50,],[31,64,]),'tuple':([0,5,12,16,28,34,36,42,45,48,51,71,],[6,6,6,6,6,6,6,6,6,6,6,6,]),'slicing':([0,5,12,16,28,34,36,42,45,48,51,71,],[14,14,14,14,14,14,14,14,14,14,14,14,]),'subscription':([0,5,12,16,28,34,36,42,45,48,51,71,],[17,17,17,17,17,17,17,17,17,17,17,17,]),'tag_list':([35,66,],[56,56,]),'name':([0,5,12,16,28,34,36,42,45,48,51,71,],[19,19,19,19,19,19,19,19,19,19,19,19,]),'key_value_list':([23,],[32,]),'rule':([0,12,],[22,29,]),'validation':([0,5,12,16,28,34,36,42,45,48,51,71,],[24,24,24,24,24,24,24,24,24,24,24,24,]),'expression':([0,5,12,16,28,34,36,42,45,48,51,71,],[25,27,25,27,46,52,27,61,63,63,65,76,]),}
+_lr_goto_items = {'mandatory':([27,61,],[37,81,]),'list':([0,6,13,18,30,36,38,44,47,53,57,60,86,],[23,23,23,23,23,23,23,23,23,23,23,23,23,]),'direction':([27,],[36,]),'function_call':([0,6,13,18,30,36,38,44,47,53,57,60,86,],[2,2,2,2,2,2,2,2,2,2,2,2,2,]),'tag':([37,81,84,],[64,64,91,]),'check':([30,],[48,]),'regex':([0,6,13,18,30,36,38,44,47,53,57,60,86,],[4,4,4,4,4,4,4,4,4,4,4,4,4,]),'tags':([37,81,],[63,89,]),'field':([0,6,13,18,30,36,38,44,47,53,57,60,86,],[8,8,8,8,8,8,8,8,8,8,8,8,8,]),'literal':([0,6,13,18,25,30,36,38,44,47,49,51,52,53,54,57,59,60,74,86,],[9,9,9,9,35,50,9,9,9,9,73,75,76,9,78,9,35,9,88,9,]),'dict':([0,6,13,18,30,36,38,44,47,53,57,60,86,],[10,10,10,10,10,10,10,10,10,10,10,10,10,]),'argument_list':([6,18,38,],[28,32,68,]),'main':([0,],[13,]),'empty':([27,37,61,81,],[45,66,45,66,]),'attribute_reference':([0,6,13,18,30,36,38,44,47,53,57,60,86,],[11,11,11,11,11,11,11,11,11,11,11,11,11,]),'key_value':([25,59,],[33,79,]),'tuple':([0,6,13,18,30,36,38,44,47,53,57,60,86,],[7,7,7,7,7,7,7,7,7,7,7,7,7,]),'slicing':([0,6,13,18,30,36,38,44,47,53,57,60,86,],[16,16,16,16,16,16,16,16,16,16,16,16,16,]),'subscription':([0,6,13,18,30,36,38,44,47,53,57,60,86,],[19,19,19,19,19,19,19,19,19,19,19,19,19,]),'tag_list':([37,81,],[65,65,]),'name':([0,6,13,18,30,36,38,44,47,53,57,60,86,],[21,21,21,21,21,21,21,21,21,21,21,21,21,]),'key_value_list':([25,],[34,]),'rule':([0,13,],[24,31,]),'validation':([0,6,13,18,30,36,38,44,47,53,57,60,86,],[26,26,26,26,26,26,26,26,26,26,26,26,26,]),'expression':([0,6,13,18,30,36,38,44,47,53,57,60,86,],[27,29,27,29,55,61,29,70,72,77,72,80,92,]),}
 
 _lr_goto = { }
 for _k, _v in _lr_goto_items.items():
@@ -26,54 +26,63 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> main","S'",1,None,None,None),
-  ('main -> rule','main',1,'p_main','/home/geertj/Projects/argproc/lib/argproc/parser.py',345),
-  ('main -> main rule','main',2,'p_main','/home/geertj/Projects/argproc/lib/argproc/parser.py',346),
-  ('rule -> expression mandatory tags','rule',3,'p_rule','/home/geertj/Projects/argproc/lib/argproc/parser.py',354),
-  ('rule -> expression direction expression mandatory tags','rule',5,'p_rule','/home/geertj/Projects/argproc/lib/argproc/parser.py',355),
-  ('expression -> literal','expression',1,'p_expresssion','/home/geertj/Projects/argproc/lib/argproc/parser.py',363),
-  ('expression -> tuple','expression',1,'p_expresssion','/home/geertj/Projects/argproc/lib/argproc/parser.py',364),
-  ('expression -> list','expression',1,'p_expresssion','/home/geertj/Projects/argproc/lib/argproc/parser.py',365),
-  ('expression -> dict','expression',1,'p_expresssion','/home/geertj/Projects/argproc/lib/argproc/parser.py',366),
-  ('expression -> name','expression',1,'p_expresssion','/home/geertj/Projects/argproc/lib/argproc/parser.py',367),
-  ('expression -> field','expression',1,'p_expresssion','/home/geertj/Projects/argproc/lib/argproc/parser.py',368),
-  ('expression -> function_call','expression',1,'p_expresssion','/home/geertj/Projects/argproc/lib/argproc/parser.py',369),
-  ('expression -> attribute_reference','expression',1,'p_expresssion','/home/geertj/Projects/argproc/lib/argproc/parser.py',370),
-  ('expression -> subscription','expression',1,'p_expresssion','/home/geertj/Projects/argproc/lib/argproc/parser.py',371),
-  ('expression -> slicing','expression',1,'p_expresssion','/home/geertj/Projects/argproc/lib/argproc/parser.py',372),
-  ('expression -> validation','expression',1,'p_expresssion','/home/geertj/Projects/argproc/lib/argproc/parser.py',373),
-  ('literal -> INTEGER','literal',1,'p_literal','/home/geertj/Projects/argproc/lib/argproc/parser.py',378),
-  ('literal -> FLOAT','literal',1,'p_literal','/home/geertj/Projects/argproc/lib/argproc/parser.py',379),
-  ('literal -> STRING','literal',1,'p_literal','/home/geertj/Projects/argproc/lib/argproc/parser.py',380),
-  ('literal -> TRUE','literal',1,'p_literal','/home/geertj/Projects/argproc/lib/argproc/parser.py',381),
-  ('literal -> FALSE','literal',1,'p_literal','/home/geertj/Projects/argproc/lib/argproc/parser.py',382),
-  ('literal -> NONE','literal',1,'p_literal','/home/geertj/Projects/argproc/lib/argproc/parser.py',383),
-  ('tuple -> ( argument_list )','tuple',3,'p_tuple','/home/geertj/Projects/argproc/lib/argproc/parser.py',388),
-  ('tuple -> ( argument_list , )','tuple',4,'p_tuple','/home/geertj/Projects/argproc/lib/argproc/parser.py',389),
-  ('argument_list -> expression','argument_list',1,'p_argument_list','/home/geertj/Projects/argproc/lib/argproc/parser.py',395),
-  ('argument_list -> argument_list , expression','argument_list',3,'p_argument_list','/home/geertj/Projects/argproc/lib/argproc/parser.py',396),
-  ('list -> [ argument_list ]','list',3,'p_list','/home/geertj/Projects/argproc/lib/argproc/parser.py',404),
-  ('dict -> { key_value_list }','dict',3,'p_dict','/home/geertj/Projects/argproc/lib/argproc/parser.py',408),
-  ('key_value_list -> key_value','key_value_list',1,'p_key_value_list','/home/geertj/Projects/argproc/lib/argproc/parser.py',412),
-  ('key_value_list -> key_value_list , key_value','key_value_list',3,'p_key_value_list','/home/geertj/Projects/argproc/lib/argproc/parser.py',413),
-  ('key_value -> literal : expression','key_value',3,'p_key_value','/home/geertj/Projects/argproc/lib/argproc/parser.py',421),
-  ('name -> NAME','name',1,'p_name','/home/geertj/Projects/argproc/lib/argproc/parser.py',425),
-  ('field -> FIELD','field',1,'p_field','/home/geertj/Projects/argproc/lib/argproc/parser.py',429),
-  ('function_call -> expression ( )','function_call',3,'p_function_call','/home/geertj/Projects/argproc/lib/argproc/parser.py',433),
-  ('function_call -> expression ( argument_list )','function_call',4,'p_function_call','/home/geertj/Projects/argproc/lib/argproc/parser.py',434),
-  ('attribute_reference -> expression . NAME','attribute_reference',3,'p_attribute_reference','/home/geertj/Projects/argproc/lib/argproc/parser.py',441),
-  ('subscription -> expression [ expression ]','subscription',4,'p_subscription','/home/geertj/Projects/argproc/lib/argproc/parser.py',445),
-  ('slicing -> expression [ expression : expression ]','slicing',6,'p_slicing','/home/geertj/Projects/argproc/lib/argproc/parser.py',449),
-  ('validation -> field : expression','validation',3,'p_validation','/home/geertj/Projects/argproc/lib/argproc/parser.py',453),
-  ('direction -> ARROW','direction',1,'p_direction','/home/geertj/Projects/argproc/lib/argproc/parser.py',457),
-  ('direction -> LARROW','direction',1,'p_direction','/home/geertj/Projects/argproc/lib/argproc/parser.py',458),
-  ('direction -> RARROW','direction',1,'p_direction','/home/geertj/Projects/argproc/lib/argproc/parser.py',459),
-  ('mandatory -> *','mandatory',1,'p_mandatory','/home/geertj/Projects/argproc/lib/argproc/parser.py',464),
-  ('mandatory -> empty','mandatory',1,'p_mandatory','/home/geertj/Projects/argproc/lib/argproc/parser.py',465),
-  ('empty -> <empty>','empty',0,'p_empty','/home/geertj/Projects/argproc/lib/argproc/parser.py',470),
-  ('tags -> tag_list','tags',1,'p_tags','/home/geertj/Projects/argproc/lib/argproc/parser.py',474),
-  ('tags -> empty','tags',1,'p_tags','/home/geertj/Projects/argproc/lib/argproc/parser.py',475),
-  ('tag_list -> tag','tag_list',1,'p_tag_list','/home/geertj/Projects/argproc/lib/argproc/parser.py',481),
-  ('tag_list -> tag_list , tag','tag_list',3,'p_tag_list','/home/geertj/Projects/argproc/lib/argproc/parser.py',482),
-  ('tag -> @ NAME','tag',2,'p_tag','/home/geertj/Projects/argproc/lib/argproc/parser.py',489),
-  ('tag -> @ ! NAME','tag',3,'p_tag','/home/geertj/Projects/argproc/lib/argproc/parser.py',490),
+  ('main -> rule','main',1,'p_main','/root/package/lib/argproc/parser.py',585),
+  ('main -> main rule','main',2,'p_main','/root/package/lib/argproc/parser.py',586),
+  ('rule -> expression mandatory tags','rule',3,'p_rule','/root/package/lib/argproc/parser.py',594),
+  ('rule -> expression direction expression mandatory tags','rule',5,'p_rule','/root/package/lib/argproc/parser.py',595),
+  ('expression -> literal','expression',1,'p_expresssion','/root/package/lib/argproc/parser.py',603),
+  ('expression -> tuple','expression',1,'p_expresssion','/root/package/lib/argproc/parser.py',604),
+  ('expression -> list','expression',1,'p_expresssion','/root/package/lib/argproc/parser.py',605),
+  ('expression -> dict','expression',1,'p_expresssion','/root/package/lib/argproc/parser.py',606),
+  ('expression -> name','expression',1,'p_expresssion','/root/package/lib/argproc/parser.py',607),
+  ('expression -> field','expression',1,'p_expresssion','/root/package/lib/argproc/parser.py',608),
+  ('expression -> function_call','expression',1,'p_expresssion','/root/package/lib/argproc/parser.py',609),
+  ('expression -> attribute_reference','expression',1,'p_expresssion','/root/package/lib/argproc/parser.py',610),
+  ('expression -> subscription','expression',1,'p_expresssion','/root/package/lib/argproc/parser.py',611),
+  ('expression -> slicing','expression',1,'p_expresssion','/root/package/lib/argproc/parser.py',612),
+  ('expression -> validation','expression',1,'p_expresssion','/root/package/lib/argproc/parser.py',613),
+  ('expression -> regex','expression',1,'p_expresssion','/root/package/lib/argproc/parser.py',614),
+  ('literal -> INTEGER','literal',1,'p_literal','/root/package/lib/argproc/parser.py',619),
+  ('literal -> FLOAT','literal',1,'p_literal','/root/package/lib/argproc/parser.py',620),
+  ('literal -> STRING','literal',1,'p_literal','/root/package/lib/argproc/parser.py',621),
+  ('literal -> TRUE','literal',1,'p_literal','/root/package/lib/argproc/parser.py',622),
+  ('literal -> FALSE','literal',1,'p_literal','/root/package/lib/argproc/parser.py',623),
+  ('literal -> NONE','literal',1,'p_literal','/root/package/lib/argproc/parser.py',624),
+  ('regex -> REGEX','regex',1,'p_regex','/root/package/lib/argproc/parser.py',629),
+  ('tuple -> ( argument_list )','tuple',3,'p_tuple','/root/package/lib/argproc/parser.py',638),
+  ('tuple -> ( argument_list , )','tuple',4,'p_tuple','/root/package/lib/argproc/parser.py',639),
+  ('argument_list -> expression','argument_list',1,'p_argument_list','/root/package/lib/argproc/parser.py',645),
+  ('argument_list -> argument_list , expression','argument_list',3,'p_argument_list','/root/package/lib/argproc/parser.py',646),
+  ('list -> [ argument_list ]','list',3,'p_list','/root/package/lib/argproc/parser.py',654),
+  ('dict -> { key_value_list }','dict',3,'p_dict','/root/package/lib/argproc/parser.py',658),
+  ('key_value_list -> key_value','key_value_list',1,'p_key_value_list','/root/package/lib/argproc/parser.py',662),
+  ('key_value_list -> key_value_list , key_value','key_value_list',3,'p_key_value_list','/root/package/lib/argproc/parser.py',663),
+  ('key_value -> literal : expression','key_value',3,'p_key_value','/root/package/lib/argproc/parser.py',671),
+  ('name -> NAME','name',1,'p_name','/root/package/lib/argproc/parser.py',675),
+  ('field -> FIELD','field',1,'p_field','/root/package/lib/argproc/parser.py',679),
+  ('function_call -> expression ( )','function_call',3,'p_function_call','/root/package/lib/argproc/parser.py',686),
+  ('function_call -> expression ( argument_list )','function_call',4,'p_function_call','/root/package/lib/argproc/parser.py',687),
+  ('attribute_reference -> expression . NAME','attribute_reference',3,'p_attribute_reference','/root/package/lib/argproc/parser.py',694),
+  ('subscription -> expression [ expression ]','subscription',4,'p_subscription','/root/package/lib/argproc/parser.py',698),
+  ('slicing -> expression [ expression : expression ]','slicing',6,'p_slicing','/root/package/lib/argproc/parser.py',702),
+  ('validation -> field : expression','validation',3,'p_validation','/root/package/lib/argproc/parser.py',706),
+  ('validation -> field : check','validation',3,'p_validation','/root/package/lib/argproc/parser.py',707),
+  ('check -> literal DOTDOT literal','check',3,'p_check','/root/package/lib/argproc/parser.py',721),
+  ('check -> GE literal','check',2,'p_check','/root/package/lib/argproc/parser.py',722),
+  ('check -> > literal','check',2,'p_check','/root/package/lib/argproc/parser.py',723),
+  ('check -> LARROW literal','check',2,'p_check','/root/package/lib/argproc/parser.py',724),
+  ('check -> < literal','check',2,'p_check','/root/package/lib/argproc/parser.py',725),
+  ('check -> IS expression','check',2,'p_check','/root/package/lib/argproc/parser.py',726),
+  ('direction -> ARROW','direction',1,'p_direction','/root/package/lib/argproc/parser.py',736),
+  ('direction -> LARROW','direction',1,'p_direction','/root/package/lib/argproc/parser.py',737),
+  ('direction -> RARROW','direction',1,'p_direction','/root/package/lib/argproc/parser.py',738),
+  ('mandatory -> *','mandatory',1,'p_mandatory','/root/package/lib/argproc/parser.py',743),
+  ('mandatory -> empty','mandatory',1,'p_mandatory','/root/package/lib/argproc/parser.py',744),
+  ('empty -> <empty>','empty',0,'p_empty','/root/package/lib/argproc/parser.py',749),
+  ('tags -> tag_list','tags',1,'p_tags','/root/package/lib/argproc/parser.py',753),
+  ('tags -> empty','tags',1,'p_tags','/root/package/lib/argproc/parser.py',754),
+  ('tag_list -> tag','tag_list',1,'p_tag_list','/root/package/lib/argproc/parser.py',760),
+  ('tag_list -> tag_list , tag','tag_list',3,'p_tag_list','/root/package/lib/argproc/parser.py',761),
+  ('tag -> @ NAME','tag',2,'p_tag','/root/package/lib/argproc/parser.py',768),
+  ('tag -> @ ! NAME','tag',3,'p_tag','/root/package/lib/argproc/parser.py',769),
 ]
@@ -0,0 +1,218 @@
+#
+# This file is part of ArgProc. ArgProc is free software that is made
+# available under the MIT license. Consult the file "LICENSE" that is
+# distributed together with this file for the exact licensing terms.
+#
+# ArgProc is copyright (c) 2010 by the ArgProc authors. See the file
+# "AUTHORS" for a complete overview.
+
+import re
+import operator
+
+from argproc.parser import Field, FieldPath
+
+_re_separator = re.compile(r'[.\[]')
+
+
+def _prefixes(name):
+    """Return the proper prefixes of field path `name', e.g. `address'
+    and `address.geo' for `address.geo.lat'."""
+    return [ name[:match.start()] for match in _re_separator.finditer(name) ]
+
+
+class Step(object):
+    """One rule, oriented for a direction."""
+
+    def __init__(self, rule, direction, ispec=None, ospec=None):
+        self.rule = rule
+        if direction == '=>':
+            self.iside, self.oside = 'left', 'right'
+        else:
+            self.iside, self.oside = 'right', 'left'
+        if ispec is None:
+            ispec = getattr(rule, self.iside)
+        if ospec is None:
+            ospec = getattr(rule, self.oside)
+        self.ispec = ispec
+        self.ospec = ospec
+        # A step that does not store is evaluated for its checks only.
+        self.store = True
+        # Maps the input fields of a fused step to the fields they replace,
+        # for error reporting.
+        self.aliases = None
+        # Statistics that are collected for adaptive ordering.
+        self.calls = 0
+        self.failures = 0
+        self.elapsed = 0.0
+        inputs = ispec.referenced_nodes()
+        self.inputs = inputs
+        self.fields = [ node.name for node in inputs
+                        if not isinstance(node, FieldPath) ]
+        self.paths = [ node for node in inputs if isinstance(node, FieldPath) ]
+        self.outputs = ospec.assigned_nodes()
+
+    def key(self):
+        """Return a key that is equal for steps that are equivalent."""
+        return (self.ispec.tostring(), self.ospec.tostring(),
+                self.rule.mandatory)
+
+
+class Mapping(object):
+    """Steps that copy one field to another, evaluated together.
+
+    `getter' returns the values of all source fields as a tuple in a single
+    call, or raises KeyError if a source field is missing.
+    """
+
+    def __init__(self, steps):
+        self.steps = steps
+        self.sources = [ step.ispec.name for step in steps ]
+        self.targets = [ step.ospec.name for step in steps ]
+        self.getter = operator.itemgetter(*self.sources)
+
+    @staticmethod
+    def applies(step):
+        """Return whether `step' only copies a field."""
+        return step.store and not step.aliases \
+                and type(step.ispec) is Field and type(step.ospec) is Field
+
+
+class Plan(object):
+    """The rules that apply to one direction and set of tags, in evaluation
+    order."""
+
+    def __init__(self, direction, steps):
+        self.direction = direction
+        self.steps = steps
+        # The order in which steps are evaluated in adaptive mode.
+        self.order = steps
+        self.calls = 0
+        fields = set()
+        for step in self.steps:
+            fields.update(node.root for node in step.inputs)
+        self.fields = frozenset(fields)
+        # Runs of consecutive steps that only copy a field are evaluated in
+        # bulk, at the position of the run, so that the steps are still
+        # evaluated in plan order. `sequence' holds the other steps and
+        # these mappings in evaluation order.
+        sequence = []
+        run = []
+        for step in self.steps + [None]:
+            if step is not None and Mapping.applies(step):
+                run.append(step)
+                continue
+            if len(run) > 1:
+                sequence.append(Mapping(run))
+            else:
+                sequence += run
+            run = []
+            if step is not None:
+                sequence.append(step)
+        self.sequence = sequence
+        self.mappings = [ item for item in sequence
+                          if isinstance(item, Mapping) ]
+        # The steps that are submitted to an executor. They are found when
+        # the plan is first evaluated with an executor.
+        self.blocking = None
+        # Inverted indices from input fields to the steps that reference
+        # them, and from output fields to the steps that assign them.
+        # Input fields are also indexed by the prefixes of their path in
+        # `nested', so that a change can be reported for either $address or
+        # $address.city.
+        self.readers = {}
+        self.nested = {}
+        self.writers = {}
+        for i in range(len(self.steps)):
+            step = self.steps[i]
+            for node in step.inputs:
+                self.readers.setdefault(node.name, []).append(i)
+                for prefix in _prefixes(node.name):
+                    self.nested.setdefault(prefix, []).append(i)
+            for node in step.outputs:
+                self.writers.setdefault(node.root, []).append(i)
+
+    def _closure(self, indices):
+        """Extend the steps in `indices' with all steps that assign to the
+        same output fields. Return the steps in evaluation order, and the
+        output fields they assign."""
+        selected = set(indices)
+        pending = list(selected)
+        outputs = set()
+        while pending:
+            step = self.steps[pending.pop()]
+            for node in step.outputs:
+                if node.root in outputs:
+                    continue
+                outputs.add(node.root)
+                for i in self.writers[node.root]:
+                    if i not in selected:
+                        selected.add(i)
+                        pending.append(i)
+        steps = [ self.steps[i] for i in sorted(selected) ]
+        return steps, outputs
+
+    def dependents(self, fields):
+        """Return the steps that need to be re-evaluated when the input
+        fields `fields' change, and the output fields they assign."""
+        indices = set()
+        for field in fields:
+            # The steps that reference the field, a field inside it, or a
+            # field that contains it.
+            indices.update(self.readers.get(field, ()))
+            indices.update(self.nested.get(field, ()))
+            for prefix in _prefixes(field):
+                indices.update(self.readers.get(prefix, ()))
+        return self._closure(indices)
+
+    def projection(self, fields):
+        """Return the steps that are needed to produce the output fields
+        `fields', and the output fields they assign."""
+        indices = set()
+        for field in fields:
+            indices.update(self.writers.get(field, ()))
+        return self._closure(indices)
+
+    def _score(self, step):
+        """INTERNAL: the expected time spent in `step' per rejection it
+        causes. Lower is better."""
+        if not step.failures:
+            return float('inf')
+        return step.elapsed / step.failures
+
+    def reorder(self):
+        """Reorder the steps for adaptive evaluation, based on the collected
+        statistics. Steps that are cheap and fail often go first. Steps that
+        assign the same output field keep their relative order, so the
+        result is the same as in declaration order."""
+        waiting = {}
+        for i in range(len(self.steps)):
+            waiting[i] = 0
+        successors = {}
+        for field, indices in self.writers.items():
+            indices = [ i for i in indices if self.steps[i].store ]
+            for i in range(1, len(indices)):
+                successors.setdefault(indices[i-1], []).append(indices[i])
+                waiting[indices[i]] += 1
+        ready = [ i for i in waiting if not waiting[i] ]
+        order = []
+        while ready:
+            ready.sort(key=lambda i: (self._score(self.steps[i]), i))
+            i = ready.pop(0)
+            order.append(self.steps[i])
+            for j in successors.get(i, ()):
+                waiting[j] -= 1
+                if not waiting[j]:
+                    ready.append(j)
+        self.order = order
+
+
+class RuleSet(object):
+    """An immutable sequence of rules, and the plans compiled from it.
+
+    A processor replaces its rule set as a whole, so that a call that is in
+    progress keeps using the plans of the rule set it started with.
+    """
+
+    def __init__(self, rules=()):
+        self.rules = tuple(rules)
+        self.plans = {}
@@ -69,30 +69,24 @@ class Parser(object):
             column = None
         return lineno, column
 
-    def t_ANY_error(self, t):
-        err = self.exception()
-        msg = 'illegal token'
+    def _raise_error(self, msg, o):
+        """Raise an exception with message `msg' for token `o'."""
+        attrs = {}
         if self._fname:
-            err.fname = self._fname
+            attrs['fname'] = self._fname
             msg += ' in file %s' % self._fname
-            lineno, column = self._position(t)
+            lineno, column = self._position(o)
             if lineno is not None and column is not None:
                 msg += ' at %d:%d' % (lineno, column)
-                err.lineno = lineno
-                err.column = column
+                attrs['lineno'] = lineno
+                attrs['column'] = column
+        err = self.exception(msg)
+        err.__dict__.update(attrs)
         err.args = (msg,)
         raise err
 
+    def t_ANY_error(self, t):
+        self._raise_error('illegal token', t)
+
     def p_error(self, p):
-        err = self.exception()
-        msg = 'syntax error'
-        if self._fname:
-            err.fname = self._fname
-            msg += ' in file %s' % self._fname
-            lineno, column = self._position(p)
-            if lineno is not None and column is not None:
-                msg += ' at %d:%d' % (lineno, column)
-                err.lineno = lineno
-                err.column = column
-        err.args = (msg,)
-        raise err
+        self._raise_error('syntax error', p)
@@ -7,23 +7,47 @@
 # "AUTHORS" for a complete overview.
 
 import sys
+from timeit import default_timer
 
 from argproc.error import *
+from argproc.adapter import InputAdapter
 from argproc.parser import RuleParser
+from argproc.loader import RuleLoader
+from argproc.plan import Plan, Step, Mapping, RuleSet
+from argproc.optimizer import optimize, has_checks, strip_validations
+from argproc.explain import explain_plan
+from argproc.fusion import fuse, CallArgs
+from argproc.executor import find_blocking, submit
+from argproc.zerocopy import zero_copy
 
 
 class ArgumentProcessor(object):
     """Rule-based arguments processor."""
 
+    # In adaptive mode, reorder rules every this many calls.
+    reorder_interval = 1000
+    # In zero-copy mode, slice bytes-like values of at least this many bytes
+    # through a memoryview.
+    zero_copy_size = 4096
+
     def __init__(self, namespace=None, tags=None, ignore_none=False,
-                 ignore_missing=False):
+                 ignore_missing=False, adapter=None, optimize=False,
+                 adaptive=False, tracer=None, trusted=False, executor=None,
+                 zero_copy=False):
         if namespace is None:
             namespace = self._get_caller_namespace(2)
         self.namespace = namespace
         self.tags = tags
         self.ignore_none = ignore_none
         self.ignore_missing = ignore_missing
-        self._rules = []
+        self.adapter = adapter
+        self.optimize = optimize
+        self.adaptive = adaptive
+        self.tracer = tracer
+        self.trusted = trusted
+        self.executor = executor
+        self.zero_copy = zero_copy
+        self._ruleset = RuleSet()
         self._parser = RuleParser()
 
     def _get_caller_namespace(self, level):
@@ -37,41 +61,67 @@ class ArgumentProcessor(object):
 
     def rules(self, rule):
         rules = self._parser.parse(rule)
-        self._rules += rules
+        self._ruleset = RuleSet(self._ruleset.rules + tuple(rules))
 
     rule = rules
 
-    def _process_rule(self, args, ispec, ospec, rule):
-        """INTERNAL: process one rule."""
-        result = {}
+    def load(self, fnames, loader=None):
+        """Add the rules in the files `fnames', and the files that they
+        include. See RuleLoader."""
+        if loader is None:
+            loader = RuleLoader()
+        rules = loader.load(fnames)
+        self._ruleset = RuleSet(self._ruleset.rules + tuple(rules))
+
+    def _process_rule(self, args, step, result):
+        """INTERNAL: process one rule, assigning its outputs to `result'.
+        Return False if the rule was skipped because of missing fields."""
+        rule = step.rule
+        ispec = step.ispec
+        ospec = step.ospec
         missing = []
-        for field in ispec.referenced_fields():
+        for field in step.fields:
             if field not in args:
                 missing.append(field)
+        for field in step.paths:
+            if not field.exists(args):
+                missing.append(field.name)
         if missing:
             if rule.mandatory and not self.ignore_missing:
+                if step.aliases:
+                    missing = self._unalias(missing, step.aliases)
                 m = 'Required %s fields missing: %s' % \
-                        (ispec.side, ', '.join(missing))
+                        (step.iside, ', '.join(missing))
                 raise MissingFieldError(m, fields=missing, rule=rule)
-            return result
+            return False
         ivalue = ispec.eval(args, self.namespace)
-        if self.ignore_none and ivalue is None:
-            return result
-        ofields = ospec.assigned_fields()
+        if not step.store or self.ignore_none and ivalue is None:
+            return True
+        ofields = step.outputs
         if len(ofields) == 1:
-            result[ofields[0]] = ivalue
+            ofields[0].assign(result, ivalue)
         else:
             if not isinstance(ivalue, tuple) and not isinstance(ivalue, list):
                 m = 'Expression on %s hand size should evaluate in a tuple ' \
                     'or list in case of multiple fields on %s hand side.' % \
-                        (ispec.side, ospec.side)
-                raise EvalError(m, fields=ofields, rule=rule)
+                        (step.iside, step.oside)
+                raise EvalError(m, fields=ospec.assigned_fields(), rule=rule)
             if len(ofields) != len(ivalue):
                 m = 'Wrong number of fields on %s hand side (%d expect %d)' % \
-                        (ospec.side, len(ofields), len(ivalue))
-                raise EvalError(m, fields=ofields, rule=rule)
+                        (step.oside, len(ofields), len(ivalue))
+                raise EvalError(m, fields=ospec.assigned_fields(), rule=rule)
             for i in range(len(ofields)):
-                result[ofields[i]] = ivalue[i]
+                ofields[i].assign(result, ivalue[i])
+        return True
+
+    def _unalias(self, fields, aliases):
+        """INTERNAL: map the input fields of a fused step back to the fields
+        that they replace."""
+        result = []
+        for field in fields:
+            field = aliases.get(field, field)
+            if field not in result:
+                result.append(field)
         return result
 
     def _match_tags(self, rule, tags):
@@ -85,30 +135,301 @@ class ArgumentProcessor(object):
                 return True
         return False
 
-    def process(self, left):
+    def _plan(self, direction, ruleset=None, tags=None, trusted=None):
+        """INTERNAL: return the (cached) plan for `direction'. If `tags' or
+        `trusted' is None, the setting of the processor is used. A trusted
+        plan does not evaluate validations. In zero-copy mode, slicings
+        return memoryviews."""
+        if ruleset is None:
+            ruleset = self._ruleset
+        if tags is None:
+            tags = self.tags
+        if tags is not None:
+            tags = frozenset(tags)
+        if trusted is None:
+            trusted = self.trusted
+        key = (direction, tags, bool(trusted), bool(self.zero_copy))
+        try:
+            return ruleset.plans[key]
+        except KeyError:
+            pass
+        steps = [ Step(rule, direction) for rule in ruleset.rules
+                  if rule.direction in (direction, '<=>')
+                        and self._match_tags(rule, tags) ]
+        if trusted:
+            steps = [ Step(step.rule, direction, strip_validations(step.ispec),
+                           step.ospec) for step in steps ]
+        if self.zero_copy:
+            steps = [ Step(step.rule, direction,
+                           zero_copy(step.ispec, self.zero_copy_size),
+                           step.ospec) for step in steps ]
+        if self.optimize:
+            steps = optimize(steps, ignore_none=self.ignore_none,
+                             ignore_missing=self.ignore_missing)
+        plan = Plan(direction, steps)
+        ruleset.plans[key] = plan
+        return plan
+
+    def compile(self):
+        """Compile the plans for both directions now, rather than on first
+        use."""
+        for direction in ('=>', '<='):
+            self._plan(direction)
+
+    def then(self, other):
+        """Return a processor that processes arguments with this processor
+        and then with `other', in one pass. In reverse, it processes with
+        `other' and then with this processor."""
+        return ComposedProcessor(self, other)
+
+    def explain(self, direction='=>', tags=None, trusted=None):
+        """Return a description of the plan that is used to process
+        arguments in `direction' ('=>' or '<='). If `tags' or `trusted' is
+        None, the setting of the processor is used."""
+        plan = self._plan(direction, tags=tags, trusted=trusted)
+        if tags is None:
+            tags = self.tags
+        return explain_plan(plan, self.namespace, tags)
+
+    def _process(self, args, direction, only=None, trusted=None):
+        """INTERNAL: process `args' in `direction'."""
+        tracer = self.tracer
+        if tracer is not None and tracer.sampled():
+            return self._process_traced(args, direction, only, trusted,
+                                        tracer)
+        plan = self._plan(direction, trusted=trusted)
+        if self.adapter is not None and not isinstance(args, InputAdapter):
+            args = self.adapter(args, plan.fields)
+        result = {}
+        if only is None:
+            self._evaluate(args, plan, result)
+            return result
+        steps, outputs = plan.projection(only)
+        for step in steps:
+            self._process_rule(args, step, result)
+        for field in outputs.difference(only):
+            result.pop(field, None)
+        return result
+
+    def _process_traced(self, args, direction, only, trusted, tracer):
+        """INTERNAL: process `args' in `direction', reporting to `tracer'.
+        The steps are evaluated one by one in plan order."""
+        tracer.process_start(direction, args)
+        start = default_timer()
+        result = error = None
+        try:
+            plan = self._plan(direction, trusted=trusted)
+            if self.adapter is not None and \
+                    not isinstance(args, InputAdapter):
+                args = self.adapter(args, plan.fields)
+            if only is None:
+                steps, outputs = plan.steps, set()
+            else:
+                steps, outputs = plan.projection(only)
+            result = {}
+            for step in steps:
+                self._trace_rule(args, step, result, tracer)
+            for field in outputs.difference(only or ()):
+                result.pop(field, None)
+        except Exception, error:
+            result = None
+            raise
+        finally:
+            tracer.process_end(direction, result, error,
+                               default_timer() - start)
+        return result
+
+    def _trace_rule(self, args, step, result, tracer):
+        """INTERNAL: process one rule, reporting to `tracer'."""
+        start = default_timer()
+        try:
+            evaluated = self._process_rule(args, step, result)
+        except Exception, e:
+            tracer.rule_failed(step.rule, e, default_timer() - start)
+            raise
+        if evaluated:
+            tracer.rule_evaluated(step.rule, default_timer() - start)
+        else:
+            tracer.rule_skipped(step.rule)
+
+    def _evaluate(self, args, plan, result):
+        """INTERNAL: evaluate all steps of `plan' on `args', assigning the
+        outputs to `result'."""
+        if self.adaptive:
+            self._process_adaptive(args, plan, result)
+            return
+        if self.executor is not None:
+            if plan.blocking is None:
+                plan.blocking = find_blocking(plan, self.namespace)
+            if plan.blocking:
+                self._process_concurrent(args, plan, result)
+                return
+        for item in plan.sequence:
+            if type(item) is Mapping:
+                self._process_mapping(args, item, result)
+            else:
+                self._process_rule(args, item, result)
+
+    def _process_blocking(self, args, step):
+        """INTERNAL: process blocking step `step'. Return its outputs."""
+        result = {}
+        self._process_rule(args, step, result)
+        return result
+
+    def _process_concurrent(self, args, plan, result):
+        """INTERNAL: evaluate the steps of `plan', submitting the
+        blocking steps to the executor. The outputs are merged in plan order,
+        and the first error in plan order is raised."""
+        pending = {}
+        for step in plan.blocking:
+            pending[step] = submit(self.executor, self._process_blocking,
+                                   args, step)
+        try:
+            for item in plan.sequence:
+                if item in pending:
+                    for name, value in pending.pop(item)().items():
+                        result[name] = value
+                elif type(item) is Mapping:
+                    self._process_mapping(args, item, result)
+                else:
+                    self._process_rule(args, item, result)
+        finally:
+            # Wait for the steps that were not merged because of an error.
+            for wait in pending.values():
+                try:
+                    wait()
+                except Exception:
+                    pass
+
+    def _process_mapping(self, args, mapping, result):
+        """INTERNAL: evaluate the steps in `mapping', which only copy
+        fields."""
+        try:
+            values = mapping.getter(args)
+        except (KeyError, IndexError):
+            values = None
+        if values is not None and not self.ignore_none:
+            result.update(zip(mapping.targets, values))
+            return
+        for step in mapping.steps:
+            source = step.ispec.name
+            if source in args:
+                value = args[source]
+                if not self.ignore_none or value is not None:
+                    result[step.ospec.name] = value
+            elif step.rule.mandatory and not self.ignore_missing:
+                m = 'Required %s fields missing: %s' % (step.iside, source)
+                raise MissingFieldError(m, fields=[source], rule=step.rule)
+
+    def _process_adaptive(self, args, plan, result):
+        """INTERNAL: process `args' according to `plan' in adaptive order,
+        collecting statistics."""
+        plan.calls += 1
+        if plan.calls % self.reorder_interval == 0:
+            plan.reorder()
+        for step in plan.order:
+            start = default_timer()
+            try:
+                self._process_rule(args, step, result)
+            except Exception:
+                step.failures += 1
+                raise
+            finally:
+                step.calls += 1
+                step.elapsed += default_timer() - start
+
+    def process(self, left, only=None, trusted=None):
         """Process the arguments in `left' and return the transformed right
-        hand side."""
-        right = {}
-        for rule in self._rules:
-            if rule.direction == '<=':
-                continue
-            if not self._match_tags(rule, self.tags):
-                continue
-            args = self._process_rule(left, rule.left, rule.right, rule)
-            right.update(args)
-        return right
-
-    def process_reverse(self, right):
+        hand side. If `only' is given, only the right hand side fields in
+        `only' are produced, and only the rules that assign them are
+        evaluated. If `trusted' is true, the arguments are known to be valid
+        and validations are skipped. If it is None, the `trusted' setting of
+        the processor is used."""
+        return self._process(left, '=>', only, trusted)
+
+    def process_reverse(self, right, only=None, trusted=None):
         """Process the arguments in `right' and return the transformed left
-        hand side."""
-        left = {}
-        for rule in self._rules:
-            if rule.direction == '=>':
-                continue
-            if not self._match_tags(rule, self.tags):
-                continue
-            args = self._process_rule(right, rule.right, rule.left, rule)
-            left.update(args)
-        return left
+        hand side. See process() for `only' and `trusted'."""
+        return self._process(right, '<=', only, trusted)
 
     reverse = process_reverse
+
+    def process_delta(self, previous, left, changed):
+        """Re-process the arguments in `left' after the fields in `changed'
+        have changed. Only the rules that depend on the changed fields are
+        evaluated. The result is `previous', the output of an earlier call
+        to process(), patched with the new values. `previous' itself is not
+        modified."""
+        plan = self._plan('=>')
+        if self.adapter is not None and not isinstance(left, InputAdapter):
+            left = self.adapter(left, plan.fields)
+        steps, outputs = plan.dependents(changed)
+        result = previous.copy()
+        for field in outputs:
+            result.pop(field, None)
+        for step in steps:
+            self._process_rule(left, step, result)
+        return result
+
+
+class ComposedProcessor(ArgumentProcessor):
+    """A processor that is the composition of two processors.
+
+    The rules of the second processor are fused with the rules of the first,
+    so that no intermediate result is created. See argproc.fusion. The input
+    adapter of the first processor is used in both directions.
+    """
+
+    def __init__(self, first, second):
+        super(ComposedProcessor, self).__init__(second.namespace,
+                ignore_missing=second.ignore_missing, adapter=first.adapter)
+        self.first = first
+        self.second = second
+        self._plan('=>')
+
+    def rules(self, rule):
+        raise TypeError('cannot add rules to a composed processor')
+
+    rule = rules
+
+    def load(self, fnames, loader=None):
+        raise TypeError('cannot add rules to a composed processor')
+
+    def _evaluate(self, args, plan, result):
+        # Expressions that are inlined in several steps are evaluated once
+        # per call.
+        if not isinstance(args, CallArgs):
+            args = CallArgs(args)
+        super(ComposedProcessor, self)._evaluate(args, plan, result)
+
+    def _plan(self, direction, ruleset=None, tags=None, trusted=None):
+        if ruleset is None:
+            ruleset = self._ruleset
+        if trusted is None:
+            trusted = self.trusted
+        key = (direction, bool(trusted))
+        try:
+            return ruleset.plans[key]
+        except KeyError:
+            pass
+        if direction == '=>':
+            steps = fuse(self.first, self.second, direction)
+        else:
+            steps = fuse(self.second, self.first, direction)
+        if trusted:
+            steps = [ self._trust(step, direction) for step in steps ]
+            steps = [ step for step in steps if step is not None ]
+        plan = Plan(direction, steps)
+        ruleset.plans[key] = plan
+        return plan
+
+    def _trust(self, step, direction):
+        """INTERNAL: return `step' without validations, or None if it is
+        no longer needed."""
+        ispec = strip_validations(step.ispec)
+        trusted = Step(step.rule, direction, ispec, step.ospec)
+        trusted.store = step.store
+        trusted.aliases = step.aliases
+        if not trusted.store and not has_checks(trusted, self.ignore_missing):
+            return None
+        return trusted
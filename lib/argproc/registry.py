@@ -0,0 +1,92 @@
+#
+# This file is part of ArgProc. ArgProc is free software that is made
+# available under the MIT license. Consult the file "LICENSE" that is
+# distributed together with this file for the exact licensing terms.
+#
+# ArgProc is copyright (c) 2010 by the ArgProc authors. See the file
+# "AUTHORS" for a complete overview.
+
+import gc
+import threading
+
+from argproc.processor import ArgumentProcessor
+
+
+class Registry(object):
+    """A registry of named processors.
+
+    Processors are declared at import time with register(). In a server
+    that forks worker processes, warm_up() is called in the master before
+    it forks, so that all processors are built and compiled once, and their
+    memory is shared by the workers. At request time, get() returns the
+    shared instance.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def register(self, name, processor):
+        """Register `processor' under `name'. `processor' is a processor,
+        or a function without arguments that creates one. A function is
+        called by warm_up(), or by get() if the processor is needed before
+        that. Return `processor'."""
+        self._lock.acquire()
+        try:
+            if name in self._entries:
+                raise ValueError('processor "%s" already registered' % name)
+            self._entries[name] = [processor, False]
+        finally:
+            self._lock.release()
+        return processor
+
+    def names(self):
+        """Return the sorted names of the registered processors."""
+        return sorted(self._entries)
+
+    def _build(self, name):
+        """INTERNAL: create and compile processor `name', if needed."""
+        entry = self._entries[name]
+        if entry[1]:
+            return entry[0]
+        self._lock.acquire()
+        try:
+            processor, compiled = entry
+            if not compiled:
+                if not isinstance(processor, ArgumentProcessor):
+                    processor = processor()
+                processor.compile()
+                entry[:] = [processor, True]
+            return entry[0]
+        finally:
+            self._lock.release()
+
+    def get(self, name):
+        """Return the processor that is registered under `name'."""
+        if name not in self._entries:
+            raise KeyError('no processor registered as "%s"' % name)
+        return self._build(name)
+
+    def warm_up(self, freeze=True):
+        """Create and compile all registered processors. If `freeze' is
+        true, the objects are then moved out of reach of the garbage
+        collector with gc.freeze() if it is available, so that collections
+        in forked workers do not touch their memory. Without gc.freeze(),
+        only a full collection is run. Return the names of the
+        processors."""
+        names = self.names()
+        for name in names:
+            self._build(name)
+        if freeze:
+            gc.collect()
+            if hasattr(gc, 'freeze'):
+                gc.freeze()
+        return names
+
+
+# The default registry.
+registry = Registry()
+
+register = registry.register
+get = registry.get
+warm_up = registry.warm_up
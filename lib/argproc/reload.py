@@ -0,0 +1,124 @@
+#
+# This file is part of ArgProc. ArgProc is free software that is made
+# available under the MIT license. Consult the file "LICENSE" that is
+# distributed together with this file for the exact licensing terms.
+#
+# ArgProc is copyright (c) 2010 by the ArgProc authors. See the file
+# "AUTHORS" for a complete overview.
+
+import os
+import threading
+
+from argproc.loader import RuleLoader
+from argproc.plan import RuleSet
+from argproc.processor import ArgumentProcessor
+
+
+class FileProcessor(ArgumentProcessor):
+    """A processor for rules that are stored in files.
+
+    The files, and the files that they include, are checked for changes
+    every `interval' seconds by a background thread. When a file has
+    changed, the files are loaded again with a RuleLoader, which only parses
+    the files with new contents. A new rule set is then compiled and swapped
+    in as a whole, so that calls that are in progress finish with the old
+    rules. If a file cannot be parsed, the old rules stay in effect and the
+    error is stored in `error'.
+
+    If `interval' is None, no thread is started and reload() needs to be
+    called explicitly.
+    """
+
+    def __init__(self, fnames, interval=1.0, namespace=None, workers=4,
+                 **kwargs):
+        if namespace is None:
+            namespace = self._get_caller_namespace(2)
+        super(FileProcessor, self).__init__(namespace, **kwargs)
+        self.fnames = list(fnames)
+        self.interval = interval
+        self.error = None
+        self._files = {}
+        self._loader = RuleLoader(workers)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self.reload(raise_error=True)
+        self._thread = None
+        if interval is not None:
+            self._thread = threading.Thread(target=self._watch)
+            self._thread.setDaemon(True)
+            self._thread.start()
+
+    def rules(self, rule):
+        raise TypeError('rules of a FileProcessor come from its files')
+
+    rule = rules
+
+    def load(self, fnames, loader=None):
+        raise TypeError('rules of a FileProcessor come from its files')
+
+    def _signature(self, fname):
+        """INTERNAL: return a value that changes when `fname' changes."""
+        st = os.stat(fname)
+        return (st.st_mtime, st.st_size)
+
+    def _watch(self):
+        """INTERNAL: background thread that watches the files."""
+        while not self._stop.isSet():
+            self._stop.wait(self.interval)
+            if not self._stop.isSet():
+                self.reload()
+
+    def changed(self):
+        """Return the files that changed since they were last loaded."""
+        changed = []
+        for fname in self._loader.files or self.fnames:
+            try:
+                signature = self._signature(fname)
+            except OSError:
+                signature = None
+            if self._files.get(fname) != signature:
+                changed.append(fname)
+        return changed
+
+    def reload(self, raise_error=False):
+        """Reload the files that changed. Return whether the rules were
+        replaced."""
+        self._lock.acquire()
+        try:
+            changed = self.changed()
+            if not changed:
+                return False
+            try:
+                # Take the signatures before the files are read, so that a
+                # change while loading is seen by the next call.
+                files = {}
+                for fname in self._loader.files:
+                    try:
+                        files[fname] = self._signature(fname)
+                    except OSError:
+                        files[fname] = None
+                rules = self._loader.load(self.fnames)
+                for fname in self._loader.files:
+                    if fname not in files:
+                        files[fname] = self._signature(fname)
+            except Exception, e:
+                self.error = e
+                if raise_error:
+                    raise
+                return False
+            ruleset = RuleSet(rules)
+            for direction in ('=>', '<='):
+                self._plan(direction, ruleset)
+            self._files = files
+            self._ruleset = ruleset
+            self.error = None
+            return True
+        finally:
+            self._lock.release()
+
+    def close(self):
+        """Stop watching the files."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
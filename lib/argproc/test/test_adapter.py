@@ -0,0 +1,102 @@
+#
+# This file is part of ArgProc. ArgProc is free software that is made
+# available under the MIT license. Consult the file "LICENSE" that is
+# distributed together with this file for the exact licensing terms.
+#
+# ArgProc is copyright (c) 2010 by the ArgProc authors. See the file
+# "AUTHORS" for a complete overview.
+
+from nose.tools import assert_raises
+
+from argproc import ArgumentProcessor as ArgProc
+from argproc import Error, AttributeAdapter, MultiDictAdapter
+from argproc import GetterAdapter, LazyAdapter
+
+
+class Record(object):
+
+    def __init__(self, **kwargs):
+        self.accessed = []
+        self.__dict__.update(kwargs)
+
+    def __getattribute__(self, name):
+        if not name.startswith('_') and name != 'accessed':
+            self.accessed.append(name)
+        return object.__getattribute__(self, name)
+
+
+class MultiDict(object):
+
+    def __init__(self, items):
+        self.items = items
+
+    def getall(self, name):
+        return [ value for key,value in self.items if key == name ]
+
+
+class TestAdapter(object):
+
+    def test_attribute(self):
+        proc = ArgProc(adapter=AttributeAdapter)
+        proc.rule('$left <=> $right')
+        assert proc.process(Record(left=10)) == {'right': 10}
+        assert proc.reverse(Record(right=10)) == {'left': 10}
+        assert proc.process(Record()) == {}
+
+    def test_attribute_touches_referenced_fields_only(self):
+        proc = ArgProc(adapter=AttributeAdapter)
+        proc.rules("""
+            $id:int <=> $id
+            $name <=> $name
+            $left => $right
+            """)
+        record = Record(id=1, name='test', other='other')
+        assert proc.reverse(record) == {'id': 1, 'name': 'test'}
+        assert sorted(record.accessed) == ['id', 'name']
+
+    def test_attribute_missing_mandatory(self):
+        proc = ArgProc(adapter=AttributeAdapter)
+        proc.rule('$left <=> $right *')
+        assert_raises(Error, proc.process, Record())
+
+    def test_multidict(self):
+        proc = ArgProc(adapter=MultiDictAdapter)
+        proc.rule('$left:int => $right')
+        form = MultiDict([('left', 1), ('left', 2)])
+        assert proc.process(form) == {'right': 1}
+        assert proc.process(MultiDict([])) == {}
+
+    def test_multidict_plain_mapping(self):
+        proc = ArgProc(adapter=MultiDictAdapter)
+        proc.rule('$left => $right')
+        assert proc.process({'left': [1, 2]}) == {'right': 1}
+        assert proc.process({'left': 1}) == {'right': 1}
+
+    def test_getter(self):
+        calls = []
+        def getter(name):
+            calls.append(name)
+            if name != 'left':
+                raise KeyError(name)
+            return 10
+        proc = ArgProc(adapter=GetterAdapter)
+        proc.rule('$left:int => $right *')
+        assert proc.process(getter) == {'right': 10}
+        assert calls == ['left']
+
+    def test_lazy(self):
+        proc = ArgProc(adapter=LazyAdapter)
+        proc.rules("""
+            $left1 => $right1
+            $left2 => $right2
+            """)
+        def fail():
+            raise AssertionError('should not be called')
+        left = {'left1': lambda: 10, 'unused': fail}
+        assert proc.process(left) == {'right1': 10}
+
+    def test_adapter_instance(self):
+        proc = ArgProc()
+        proc.rule('$left => $right')
+        assert proc.process(AttributeAdapter(Record(left=10))) == \
+                    {'right': 10}
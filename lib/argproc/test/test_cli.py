@@ -0,0 +1,68 @@
+#
+# This file is part of ArgProc. ArgProc is free software that is made
+# available under the MIT license. Consult the file "LICENSE" that is
+# distributed together with this file for the exact licensing terms.
+#
+# ArgProc is copyright (c) 2010 by the ArgProc authors. See the file
+# "AUTHORS" for a complete overview.
+
+import os
+import json
+import tempfile
+from StringIO import StringIO
+
+from argproc.cli import main
+
+
+class TestCommandLine(object):
+
+    def setup(self):
+        fd, self.rules = tempfile.mkstemp()
+        os.write(fd, """
+            $left:int <=> $right *
+            $name <=> $name @named
+            """)
+        os.close(fd)
+
+    def teardown(self):
+        os.unlink(self.rules)
+
+    def _run(self, args, input):
+        stdout = StringIO()
+        stderr = StringIO()
+        ret = main(args, StringIO(input), stdout, stderr)
+        assert ret == 0
+        output = [ json.loads(line) for line in stdout.getvalue().splitlines() ]
+        return output, stderr.getvalue().splitlines()
+
+    def test_transform(self):
+        input = '{"left": 1, "name": "a"}\n{"left": 2}\n'
+        output, errors = self._run(['-q', self.rules], input)
+        assert output == [{'right': 1, 'name': 'a'}, {'right': 2}]
+        assert errors == []
+
+    def test_reverse(self):
+        input = '{"right": 1, "name": "a"}\n'
+        output, errors = self._run(['-q', '-r', self.rules], input)
+        assert output == [{'left': 1, 'name': 'a'}]
+
+    def test_tags(self):
+        input = '{"left": 1, "name": "a"}\n'
+        output, errors = self._run(['-q', '-t', 'other', self.rules], input)
+        assert output == [{'right': 1}]
+
+    def test_rejects(self):
+        input = '{"left": "a"}\n{}\nnot json\n{"left": 1}\n'
+        output, errors = self._run([self.rules], input)
+        assert output == [{'right': 1}]
+        rejects = [ json.loads(line) for line in errors[:-1] ]
+        assert len(rejects) == 3
+        assert rejects[0]['input'] == {'left': 'a'}
+        assert rejects[1]['fields'] == ['left']
+        assert rejects[2]['input'] == 'not json'
+        assert errors[-1].startswith('Processed 4 records (3 rejected)')
+
+    def test_workers(self):
+        input = ''.join('{"left": %d}\n' % i for i in range(100))
+        output, errors = self._run(['-q', '-j', '2', self.rules], input)
+        assert output == [ {'right': i} for i in range(100) ]
@@ -0,0 +1,102 @@
+#
+# This file is part of ArgProc. ArgProc is free software that is made
+# available under the MIT license. Consult the file "LICENSE" that is
+# distributed together with this file for the exact licensing terms.
+#
+# ArgProc is copyright (c) 2010 by the ArgProc authors. See the file
+# "AUTHORS" for a complete overview.
+
+from StringIO import StringIO
+from nose.tools import assert_raises
+
+from argproc import ArgumentProcessor as ArgProc
+from argproc import Error, blocking
+from argproc.csvpipe import CSVTransformer
+
+
+class TestCSVTransformer(object):
+
+    def test_transform(self):
+        proc = ArgProc()
+        proc.rules("""
+            int($id) <=> $objectid *
+            $name <=> $name
+            concat($first, $last) => $fullname
+            """)
+        proc.namespace['concat'] = lambda *args: ' '.join(args)
+        fin = StringIO('last,id,first,name\r\nDoe,1,John,jd\r\n'
+                       'Roe,2,Jane,\r\n')
+        fout = StringIO()
+        count = CSVTransformer(proc).transform(fin, fout)
+        assert count == 2
+        assert fout.getvalue() == 'objectid,name,fullname\r\n' \
+                                  '1,jd,John Doe\r\n2,,Jane Roe\r\n'
+
+    def test_executor(self):
+        from multiprocessing.pool import ThreadPool
+        @blocking
+        def lookup(value):
+            return value.upper()
+        pool = ThreadPool(2)
+        try:
+            proc = ArgProc(executor=pool)
+            proc.rules("""
+                $id <=> $objectid
+                lookup($name) => $name
+                """)
+            fin = StringIO('id,name\r\n1,jd\r\n')
+            fout = StringIO()
+            CSVTransformer(proc).transform(fin, fout)
+            assert fout.getvalue() == 'objectid,name\r\n1,JD\r\n'
+        finally:
+            pool.close()
+            pool.join()
+
+    def test_reverse(self):
+        proc = ArgProc()
+        proc.rule('$left <=> $right')
+        fin = StringIO('right\r\n1\r\n')
+        fout = StringIO()
+        CSVTransformer(proc, reverse=True).transform(fin, fout)
+        assert fout.getvalue() == 'left\r\n1\r\n'
+
+    def test_missing_column(self):
+        proc = ArgProc()
+        proc.rule('$left <=> $right *')
+        fin = StringIO('other\r\n1\r\n')
+        assert_raises(Error, CSVTransformer(proc).transform, fin, StringIO())
+
+    def test_optional_column(self):
+        proc = ArgProc()
+        proc.rules("""
+            $left1 => $right1
+            $left2 => $right2
+            """)
+        fin = StringIO('left2\r\n1\r\n')
+        fout = StringIO()
+        CSVTransformer(proc).transform(fin, fout)
+        assert fout.getvalue() == 'right1,right2\r\n,1\r\n'
+
+    def test_rejects(self):
+        proc = ArgProc()
+        proc.rule('$left:int => $right')
+        fin = StringIO('left\r\n1\r\na\r\n')
+        fout = StringIO()
+        rejects = StringIO()
+        CSVTransformer(proc).transform(fin, fout, rejects)
+        assert fout.getvalue() == 'right\r\n1\r\n'
+        assert rejects.getvalue().startswith('left,error\r\na,')
+        assert_raises(Error, CSVTransformer(proc).transform,
+                      StringIO('left\r\na\r\n'), StringIO())
+
+    def test_rejects_exception(self):
+        proc = ArgProc()
+        proc.rule('int($id) => $objectid')
+        fin = StringIO('id\r\n1\r\nx\r\n2\r\n')
+        fout = StringIO()
+        rejects = StringIO()
+        assert CSVTransformer(proc).transform(fin, fout, rejects) == 3
+        assert fout.getvalue() == 'objectid\r\n1\r\n2\r\n'
+        assert rejects.getvalue().startswith('id,error\r\nx,ValueError: ')
+        assert_raises(ValueError, CSVTransformer(proc).transform,
+                      StringIO('id\r\nx\r\n'), StringIO())
@@ -0,0 +1,101 @@
+#
+# This file is part of ArgProc. ArgProc is free software that is made
+# available under the MIT license. Consult the file "LICENSE" that is
+# distributed together with this file for the exact licensing terms.
+#
+# ArgProc is copyright (c) 2010 by the ArgProc authors. See the file
+# "AUTHORS" for a complete overview.
+
+import time
+from multiprocessing.pool import ThreadPool
+from nose.tools import assert_raises
+
+from argproc import ArgumentProcessor as ArgProc
+from argproc import Error, blocking
+from argproc.executor import find_blocking
+
+
+@blocking
+def lookup(value):
+    time.sleep(0.2)
+    return value.upper()
+
+@blocking
+def check(value):
+    time.sleep(value)
+    raise ValueError('invalid value %s' % value)
+
+
+class TestExecutor(object):
+
+    def setup(self):
+        self.pool = ThreadPool(4)
+
+    def teardown(self):
+        self.pool.close()
+        self.pool.join()
+
+    def test_concurrent(self):
+        proc = ArgProc(executor=self.pool)
+        proc.rules("""
+            lookup($a) => $a
+            lookup($b) => $b
+            $c <=> $c
+            lookup($d) => $d
+            int($e) => $e
+            """)
+        left = {'a': 'x', 'b': 'y', 'c': 'z', 'd': 'w', 'e': '1'}
+        start = time.time()
+        right = proc.process(left)
+        assert time.time() - start < 0.5
+        assert right == {'a': 'X', 'b': 'Y', 'c': 'z', 'd': 'W', 'e': 1}
+        assert [ step.rule.tostring() for step in proc._plan('=>').blocking ] \
+                    == ['lookup($a) => $a', 'lookup($b) => $b',
+                        'lookup($d) => $d']
+
+    def test_shared_output(self):
+        proc = ArgProc(executor=self.pool)
+        proc.rules("""
+            lookup($a) => $out
+            lookup($b) => $out
+            lookup($c) => $c
+            """)
+        plan = proc._plan('=>')
+        assert proc.process({'a': 'x', 'b': 'y', 'c': 'z'}) == \
+                    {'out': 'Y', 'c': 'Z'}
+        assert [ step.rule.tostring() for step in plan.blocking ] == \
+                    ['lookup($c) => $c']
+
+    def test_error_order(self):
+        proc = ArgProc(executor=self.pool)
+        proc.rules("""
+            $a:check => $a
+            $b:check => $b
+            """)
+        for i in range(3):
+            try:
+                proc.process({'a': 0.2, 'b': 0})
+            except Error, e:
+                assert e.fields == ['$a']
+            else:
+                assert False
+
+    def test_sequential_error_first(self):
+        proc = ArgProc(executor=self.pool)
+        proc.rules("""
+            $a:int => $a
+            $b:check => $b
+            """)
+        try:
+            proc.process({'a': 'x', 'b': 0})
+        except Error, e:
+            assert e.fields == ['$a']
+        else:
+            assert False
+
+    def test_no_executor(self):
+        proc = ArgProc()
+        proc.rule('lookup($a) => $a')
+        assert proc.process({'a': 'x'}) == {'a': 'X'}
+        assert proc._plan('=>').blocking is None
+        assert find_blocking(proc._plan('=>'), proc.namespace) != []
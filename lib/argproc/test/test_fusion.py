@@ -0,0 +1,148 @@
+#
+# This file is part of ArgProc. ArgProc is free software that is made
+# available under the MIT license. Consult the file "LICENSE" that is
+# distributed together with this file for the exact licensing terms.
+#
+# ArgProc is copyright (c) 2010 by the ArgProc authors. See the file
+# "AUTHORS" for a complete overview.
+
+from nose.tools import assert_raises
+
+from argproc import ArgumentProcessor as ArgProc
+from argproc import Error
+
+
+def double(value):
+    return 2 * value
+
+def halve(value):
+    return value // 2
+
+
+class TestFusion(object):
+
+    def test_rename(self):
+        first = ArgProc()
+        first.rule('$a <=> $b')
+        second = ArgProc()
+        second.rule('$b <=> $c')
+        proc = first.then(second)
+        assert proc.process({'a': 1}) == {'c': 1}
+        assert proc.reverse({'c': 1}) == {'a': 1}
+        assert proc.process({}) == {}
+
+    def test_expressions(self):
+        first = ArgProc()
+        first.rules("""
+            double($a) => $b
+            int($x) <=> $y
+            halve($b) <= $a
+            """)
+        second = ArgProc()
+        second.rules("""
+            (double($b), $y) <=> ($c, $d)
+            """)
+        proc = first.then(second)
+        left = {'a': 1, 'x': '2'}
+        assert proc.process(left) == second.process(first.process(left))
+        assert proc.process(left) == {'c': 4, 'd': 2}
+
+    def test_multiple_outputs(self):
+        first = ArgProc()
+        first.rule('($a, $b) => ($c, $d)')
+        second = ArgProc()
+        second.rule('$d => $e')
+        proc = first.then(second)
+        assert proc.process({'a': 1, 'b': 2}) == {'e': 2}
+
+    def test_namespaces(self):
+        first = ArgProc(namespace={'f': double})
+        first.rule('f($a) => $b')
+        second = ArgProc(namespace={'f': halve})
+        second.rule('f($b) => $c')
+        proc = first.then(second)
+        assert proc.process({'a': 3}) == {'c': 3}
+
+    def test_errors(self):
+        first = ArgProc()
+        first.rules("""
+            $a:int => $b
+            $x => $y *
+            """)
+        second = ArgProc()
+        second.rule('$b:>0 => $c *')
+        proc = first.then(second)
+        assert proc.process({'a': 1, 'x': 1}) == {'c': 1}
+        try:
+            proc.process({'a': 'a', 'x': 1})
+        except Error, e:
+            assert e.fields == ['$a']
+        else:
+            assert False
+        try:
+            proc.process({'a': 1})
+        except Error, e:
+            assert e.fields == ['x']
+            assert e.rule.tostring() == '$x => $y *'
+        else:
+            assert False
+        try:
+            proc.process({'a': 0, 'x': 1})
+        except Error, e:
+            assert e.fields == ['$b']
+        else:
+            assert False
+        try:
+            proc.process({'x': 1})
+        except Error, e:
+            assert e.fields == ['b']
+            assert e.rule.tostring() == '$b:>0 => $c *'
+        else:
+            assert False
+
+    def test_not_fusable(self):
+        first = ArgProc()
+        first.rules("""
+            $a => $b
+            $c => $b
+            """)
+        second = ArgProc()
+        second.rule('$b => $d')
+        assert_raises(Error, first.then, second)
+        second = ArgProc()
+        second.rule('$x => $d *')
+        assert_raises(Error, ArgProc().then, second)
+
+    def test_trusted(self):
+        first = ArgProc()
+        first.rule('$a:int <=> $b')
+        second = ArgProc()
+        second.rule('$b <=> $c:1..5')
+        proc = first.then(second)
+        assert_raises(Error, proc.process, {'a': 'x'})
+        assert proc.process({'a': 'x'}, trusted=True) == {'c': 'x'}
+        assert_raises(Error, proc.reverse, {'c': 6})
+        assert proc.reverse({'c': 6}, trusted=True) == {'a': 6}
+        assert len(proc._plan('=>', trusted=True).steps) == 1
+
+    def test_evaluate_once(self):
+        calls = []
+        def conv(value):
+            calls.append(value)
+            return value + 1
+        first = ArgProc()
+        first.rules("""
+            conv($x) => $y *
+            $z:int => $w *
+            """)
+        second = ArgProc()
+        second.rules("""
+            ($y, $w) => $b
+            $y => $a
+            """)
+        proc = first.then(second)
+        assert proc.process({'x': 1, 'z': 2}) == {'a': 2, 'b': (2, 2)}
+        assert calls == [1]
+        assert_raises(Error, proc.process, {'z': 2})
+        assert_raises(Error, proc.process, {'x': 1, 'z': 'a'})
+        assert calls == [1]
@@ -0,0 +1,123 @@
+#
+# This file is part of ArgProc. ArgProc is free software that is made
+# available under the MIT license. Consult the file "LICENSE" that is
+# distributed together with this file for the exact licensing terms.
+#
+# ArgProc is copyright (c) 2010 by the ArgProc authors. See the file
+# "AUTHORS" for a complete overview.
+
+import os
+import shutil
+import tempfile
+from nose.tools import assert_raises
+
+from argproc import ArgumentProcessor as ArgProc
+from argproc import Error, RuleLoader
+
+
+class TestRuleLoader(object):
+
+    def setup(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def teardown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def write(self, name, contents):
+        fname = os.path.join(self.tmpdir, name)
+        dirname = os.path.dirname(fname)
+        if not os.path.isdir(dirname):
+            os.makedirs(dirname)
+        fout = file(fname, 'w')
+        fout.write(contents)
+        fout.close()
+        return fname
+
+    def tostrings(self, rules):
+        return [ rule.tostring() for rule in rules ]
+
+    def test_load(self):
+        fnames = [ self.write('%d.rules' % i, '$left%d => $right%d' % (i, i))
+                   for i in range(10) ]
+        loader = RuleLoader(workers=4)
+        rules = loader.load(fnames)
+        assert self.tostrings(rules) == \
+                    [ '$left%d => $right%d' % (i, i) for i in range(10) ]
+        assert loader.files == fnames
+
+    def test_include(self):
+        self.write('common/address.rules', '$street => $street\n'
+                                           '#include "city.rules"')
+        self.write('common/city.rules', '$city => $city')
+        self.write('common/contact.rules', '$phone => $phone')
+        fname1 = self.write('person.rules',
+                            '#include common/address.rules\n'
+                            '#include common/contact.rules\n'
+                            '$name => $name')
+        fname2 = self.write('company.rules',
+                            '#include common/address.rules\n'
+                            '$company => $company')
+        loader = RuleLoader()
+        rules = loader.load([fname1, fname2])
+        assert self.tostrings(rules) == \
+                    ['$city => $city', '$street => $street',
+                     '$phone => $phone', '$name => $name',
+                     '$company => $company']
+        assert len(loader.files) == 5
+
+    def test_include_cycle(self):
+        fname = self.write('a.rules', '#include b.rules\n$a => $a')
+        self.write('b.rules', '#include a.rules\n$b => $b')
+        loader = RuleLoader()
+        assert_raises(Error, loader.load, [fname])
+
+    def test_include_missing(self):
+        fname = self.write('a.rules', '#include b.rules\n$a => $a')
+        loader = RuleLoader()
+        assert_raises(IOError, loader.load, [fname])
+
+    def test_workers(self):
+        import threading
+        threads = set()
+        class Loader(RuleLoader):
+            def _read(self, fname):
+                threads.add(threading.current_thread())
+                return super(Loader, self)._read(fname)
+        fnames = [ self.write('%d.rules' % i, '$left%d => $right%d' % (i, i))
+                   for i in range(4) ]
+        loader = Loader(workers=4)
+        loader.load(fnames)
+        assert threading.current_thread() not in threads
+
+    def test_cache(self):
+        fname1 = self.write('a.rules', '$left1 => $right1')
+        fname2 = self.write('b.rules', '$left2 => $right2')
+        loader = RuleLoader()
+        rules = loader.load([fname1, fname2])
+        self.write('b.rules', '$left2 => $other')
+        reloaded = loader.load([fname1, fname2])
+        assert reloaded[0] is rules[0]
+        assert reloaded[1] is not rules[1]
+        assert reloaded[1].tostring() == '$left2 => $other'
+
+    def test_parse_error(self):
+        fnames = [ self.write('%d.rules' % i, '$left <=> <=>')
+                   for i in range(4) ]
+        loader = RuleLoader(workers=4)
+        try:
+            loader.load(fnames)
+        except Error, e:
+            assert '0.rules' in str(e)
+        else:
+            assert False
+        assert loader.files == []
+
+    def test_processor_load(self):
+        self.write('common.rules', '$left1 => $right1')
+        fname = self.write('a.rules', '#include common.rules\n'
+                                      '$left2 => $right2')
+        proc = ArgProc()
+        proc.rule('$left3 => $right3')
+        proc.load([fname])
+        assert proc.process({'left1': 1, 'left2': 2, 'left3': 3}) == \
+                    {'right1': 1, 'right2': 2, 'right3': 3}
@@ -0,0 +1,91 @@
+#
+# This file is part of ArgProc. ArgProc is free software that is made
+# available under the MIT license. Consult the file "LICENSE" that is
+# distributed together with this file for the exact licensing terms.
+#
+# ArgProc is copyright (c) 2010 by the ArgProc authors. See the file
+# "AUTHORS" for a complete overview.
+
+import warnings
+from nose.tools import assert_raises
+
+from argproc import optimizer
+from argproc import ArgumentProcessor as ArgProc
+from argproc import Error, RuleWarning
+
+
+def optimized(text):
+    """Return an optimizing processor for the rules in `text', compiled
+    with overlap warnings ignored."""
+    proc = ArgProc(optimize=True)
+    proc.rules(text)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuleWarning)
+        proc.compile()
+    return proc
+
+
+def rules(proc, direction='=>'):
+    return [ step.rule.tostring() for step in proc._plan(direction).steps ]
+
+
+class TestOptimizer(object):
+
+    def test_duplicates(self):
+        proc = optimized("""
+            $left => $right
+            $other => $right
+            $left <=> $right
+            """)
+        assert rules(proc) == ['$other => $right', '$left <=> $right']
+        assert rules(proc, '<=') == ['$left <=> $right']
+        assert proc.process({'left': 1, 'other': 2}) == {'right': 1}
+
+    def test_dead_store(self):
+        proc = optimized("""
+            $left => $right
+            $other => $right *
+            """)
+        assert rules(proc) == ['$other => $right *']
+        assert proc.process({'left': 1, 'other': 2}) == {'right': 2}
+
+    def test_dead_store_constant(self):
+        proc = optimized("""
+            ($left1, $left2) => ($right1, $right2)
+            10 => $right1
+            20 => $right2
+            """)
+        assert rules(proc) == ['10 => $right1', '20 => $right2']
+
+    def test_dead_store_keeps_checks(self):
+        proc = optimized("""
+            $left:int => $right
+            $other => $right *
+            """)
+        steps = proc._plan('=>').steps
+        assert len(steps) == 2
+        assert not steps[0].store
+        assert proc.process({'left': 1, 'other': 2}) == {'right': 2}
+        assert_raises(Error, proc.process, {'left': 'a', 'other': 2})
+
+    def test_conditional_store_is_kept(self):
+        proc = optimized("""
+            $left => $right
+            $other => $right
+            """)
+        assert len(rules(proc)) == 2
+        assert proc.process({'left': 1}) == {'right': 1}
+
+    def test_overlap_warning(self):
+        proc = ArgProc(optimize=True)
+        proc.rules("""
+            $left => $right
+            $other => $right
+            """)
+        optimizer.__dict__.pop('__warningregistry__', None)
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always', RuleWarning)
+            proc.process({})
+        assert len(caught) == 1
+        assert caught[0].category is RuleWarning
+        assert '"right"' in str(caught[0].message)
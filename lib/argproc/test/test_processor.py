@@ -9,7 +9,7 @@
 from nose.tools import assert_raises
 
 from argproc import ArgumentProcessor as ArgProc
-from argproc import Error
+from argproc import Error, ValidationError
 
 
 class TestProcessor(object):
@@ -233,3 +233,382 @@ class TestProcessor(object):
         """)
         assert proc.process({'left1': 10}) == {'right1': 10}
         assert proc.process({'left2': 20}) == {}
+
+    def test_field_path(self):
+        proc = ArgProc()
+        proc.rule('$address.city <=> $city')
+        assert proc.process({'address': {'city': 'Delft'}}) == \
+                    {'city': 'Delft'}
+        assert proc.reverse({'city': 'Delft'}) == \
+                    {'address': {'city': 'Delft'}}
+
+    def test_field_path_index(self):
+        proc = ArgProc()
+        proc.rule('$items[1].sku <=> $sku')
+        left = {'items': [{'sku': 1}, {'sku': 2}]}
+        assert proc.process(left) == {'sku': 2}
+        assert proc.reverse({'sku': 2}) == {'items': [None, {'sku': 2}]}
+
+    def test_field_path_merge(self):
+        proc = ArgProc()
+        proc.rules("""
+            $city => $address.city
+            $zip => $address.zip
+            """)
+        right = proc.process({'city': 'Delft', 'zip': '2611'})
+        assert right == {'address': {'city': 'Delft', 'zip': '2611'}}
+
+    def test_field_path_attribute(self):
+        proc = ArgProc()
+        proc.rule('$name.upper() => $right')
+        assert proc.process({'name': 'test'}) == {'right': 'TEST'}
+
+    def test_field_path_method(self):
+        proc = ArgProc()
+        proc.rules("""
+            $d.keys() => $k
+            $d.get('a') => $a *
+            $d.sub.get ('b') => $b
+            """)
+        left = {'d': {'a': 1, 'sub': {'b': 2}}}
+        right = proc.process(left)
+        assert right['k'] in (['a', 'sub'], ['sub', 'a'])
+        assert right['a'] == 1 and right['b'] == 2
+        proc = ArgProc()
+        proc.rule('$name.upper() => $right *')
+        try:
+            proc.process({})
+        except Error, e:
+            assert e.fields == ['name']
+        else:
+            assert False
+
+    def test_field_path_missing(self):
+        proc = ArgProc()
+        proc.rule('$address.city => $city *')
+        try:
+            proc.process({'address': {}})
+        except Error, e:
+            assert e.fields == ['address.city']
+        else:
+            assert False
+        proc = ArgProc()
+        proc.rule('$items[2] => $item')
+        assert proc.process({'items': [1]}) == {}
+
+    def test_only(self):
+        proc = ArgProc()
+        proc.rules("""
+            ($left3, $left4) <=> ($right3, $right4)
+            $left1 <=> $right1 *
+            $left2 <=> $right2
+            """)
+        left = {'left2': 2, 'left3': 3, 'left4': 4}
+        assert proc.process(left, only=['right2']) == {'right2': 2}
+        assert proc.process(left, only=['right3']) == {'right3': 3}
+        assert_raises(Error, proc.process, left, only=['right1'])
+        assert proc.reverse({'right2': 2}, only=['left2']) == {'left2': 2}
+
+    def test_process_delta(self):
+        calls = []
+        def double(value):
+            calls.append(value)
+            return 2*value
+        proc = ArgProc()
+        proc.rules("""
+            double($left1) => $right1
+            double($left2) => $right2
+            """)
+        left = {'left1': 1, 'left2': 2}
+        previous = proc.process(left)
+        assert previous == {'right1': 2, 'right2': 4}
+        del calls[:]
+        left['left2'] = 3
+        right = proc.process_delta(previous, left, ['left2'])
+        assert right == {'right1': 2, 'right2': 6}
+        assert calls == [3]
+        assert previous == {'right1': 2, 'right2': 4}
+
+    def test_process_delta_path(self):
+        proc = ArgProc()
+        proc.rules("""
+            $address => $addr
+            $address.city => $city
+            $address.zip => $zip
+            $name => $name
+            """)
+        left = {'address': {'city': 'Delft', 'zip': '2611'}, 'name': 'n'}
+        previous = proc.process(left)
+        left = {'address': {'city': 'Leiden', 'zip': '2611'}, 'name': 'x'}
+        right = proc.process_delta(previous, left, ['address.city'])
+        assert right == {'addr': left['address'], 'city': 'Leiden',
+                         'zip': '2611', 'name': 'n'}
+        steps, outputs = proc._plan('=>').dependents(['address.city'])
+        assert outputs == set(['addr', 'city'])
+        steps, outputs = proc._plan('=>').dependents(['address'])
+        assert outputs == set(['addr', 'city', 'zip'])
+
+    def test_process_delta_shared_output(self):
+        proc = ArgProc()
+        proc.rules("""
+            $left1 => $right
+            $left2 => $right
+            """)
+        left = {'left1': 1, 'left2': 2}
+        previous = proc.process(left)
+        assert previous == {'right': 2}
+        del left['left2']
+        assert proc.process_delta(previous, left, ['left2']) == {'right': 1}
+        del left['left1']
+        assert proc.process_delta(previous, left, ['left1']) == {}
+
+    def test_adaptive(self):
+        calls = []
+        def convert(value):
+            calls.append(value)
+            return value
+        proc = ArgProc(adaptive=True)
+        proc.reorder_interval = 10
+        proc.rules("""
+            convert($left1) => $right1
+            $left2:int => $right2
+            """)
+        for i in range(20):
+            assert_raises(Error, proc.process, {'left1': 1, 'left2': 'a'})
+        del calls[:]
+        assert_raises(Error, proc.process, {'left1': 1, 'left2': 'a'})
+        assert calls == []
+        right = proc.process({'left1': 1, 'left2': 2})
+        assert right == {'right1': 1, 'right2': 2}
+
+    def test_adaptive_shared_output(self):
+        proc = ArgProc(adaptive=True)
+        proc.reorder_interval = 10
+        proc.rules("""
+            $left1 => $right
+            $left2:int => $right
+            """)
+        for i in range(20):
+            assert_raises(Error, proc.process, {'left1': 1, 'left2': 'a'})
+        assert proc.process({'left1': 1, 'left2': 2}) == {'right': 2}
+
+    def test_explain(self):
+        proc = ArgProc()
+        proc.rules("""
+            $left:int => $right *
+            $type:set(('a', 'b')) <=> $type @update
+            $name <=> $name @!update
+            """)
+        text = proc.explain()
+        assert text.startswith('Plan for => with tags: any\n')
+        assert '[1] $left:int => $right *' in text
+        assert 'tree:        Validation($left, int)' in text
+        assert "name:        int = <type 'int'>" in text
+        assert "constant:    ('a','b')" in text
+        assert '3 rules' in text
+        text = proc.explain('<=', tags=['update'])
+        assert 'with tags: update' in text
+        assert '1 rules' in text
+
+    def test_validator_regex(self):
+        proc = ArgProc()
+        proc.rule('$zip:/^[0-9]{4}[A-Z]{2}$/ => $right')
+        assert proc.process({'zip': '2611AB'}) == {'right': '2611AB'}
+        assert_raises(Error, proc.process, {'zip': '2611 AB'})
+        assert_raises(Error, proc.process, {'zip': 2611})
+
+    def test_validator_regex_message(self):
+        proc = ArgProc()
+        proc.rule('$left:/a\/b/ => $right')
+        assert proc.process({'left': 'a/b'}) == {'right': 'a/b'}
+        try:
+            proc.process({'left': 'ab'})
+        except Error, e:
+            assert str(e) == 'Could not validate field "$left": ' \
+                             'value does not match /a\/b/'
+        else:
+            assert False
+
+    def test_regex_literal(self):
+        proc = ArgProc()
+        proc.rule('/[0-9]+/.findall($left) => $right')
+        assert proc.process({'left': 'a1b22'}) == {'right': ['1', '22']}
+
+    def test_invalid_regex(self):
+        proc = ArgProc()
+        try:
+            proc.rule('$left:/a(/ => $right')
+        except Error, e:
+            assert str(e).startswith('invalid regular expression /a(/')
+        else:
+            assert False
+
+    def test_validator_range(self):
+        proc = ArgProc()
+        proc.rule('$age:1..120 => $right')
+        assert proc.process({'age': 1}) == {'right': 1}
+        assert proc.process({'age': 120}) == {'right': 120}
+        assert_raises(Error, proc.process, {'age': 0})
+        assert_raises(Error, proc.process, {'age': 121})
+        proc = ArgProc()
+        proc.rule('$value:-1.5..1.5 => $right')
+        assert proc.process({'value': -1.5}) == {'right': -1.5}
+        assert_raises(Error, proc.process, {'value': 2})
+        for value in ('1', None, True, [1]):
+            assert_raises(Error, proc.process, {'value': value})
+        proc = ArgProc()
+        proc.rule("$code:'a'..'m' => $right")
+        assert proc.process({'code': 'b'}) == {'right': 'b'}
+        assert proc.process({'code': u'b'}) == {'right': u'b'}
+        assert_raises(Error, proc.process, {'code': 1})
+
+    def test_validator_comparison(self):
+        proc = ArgProc()
+        proc.rules("""
+            $score:>=0 => $score
+            $count:>0 => $count
+            $low:<=10 => $low
+            $high:<100 => $high
+            """)
+        left = {'score': 0, 'count': 1, 'low': 10, 'high': 99}
+        assert proc.process(left) == left
+        assert_raises(Error, proc.process, {'score': -1})
+        assert_raises(Error, proc.process, {'count': 0})
+        assert_raises(Error, proc.process, {'low': 11})
+        assert_raises(Error, proc.process, {'high': 100})
+        try:
+            proc.process({'score': -1})
+        except Error, e:
+            assert str(e) == 'Could not validate field "$score": ' \
+                             'value not >=0'
+        for value in ('abc', '5', None, False):
+            assert_raises(Error, proc.process, {'score': value})
+            assert_raises(Error, proc.process, {'high': value})
+        assert proc.process({'score': 5L, 'high': 1.5}) == \
+                    {'score': 5L, 'high': 1.5}
+
+    def test_validator_type(self):
+        proc = ArgProc()
+        proc.rule('$id:is int <=> $objectid')
+        assert proc.process({'id': 1}) == {'objectid': 1}
+        assert_raises(Error, proc.process, {'id': '1'})
+        proc = ArgProc()
+        proc.rule('$value:is (int, float) => $right')
+        assert proc.process({'value': 1.5}) == {'right': 1.5}
+        try:
+            proc.process({'value': '1'})
+        except Error, e:
+            assert str(e) == 'Could not validate field "$value": ' \
+                             'value is not an instance of (int,float)'
+        else:
+            assert False
+
+    def test_check_tostring(self):
+        proc = ArgProc()
+        proc.rules("""
+            $a:1..2
+            $b:>=0
+            $c:<=0
+            $d:is int
+            """)
+        rules = [ step.rule.tostring() for step in proc._plan('=>').steps ]
+        assert rules == ['$a:1..2', '$b:>=0', '$c:<=0', '$d:is int']
+
+    def test_mapping(self):
+        proc = ArgProc()
+        proc.rules("""
+            $name <=> $name *
+            $left <=> $right
+            $a <=> $b
+            int($x) => $b
+            """)
+        plan = proc._plan('=>')
+        assert len(plan.sequence) == 2
+        assert plan.sequence[0].sources == ['name', 'left', 'a']
+        assert plan.sequence[1].rule.tostring() == 'int($x) => $b'
+        left = {'name': 'n', 'left': 1, 'a': 2, 'x': '3'}
+        assert proc.process(left) == {'name': 'n', 'right': 1, 'b': 3}
+        assert proc.process({'name': 'n'}) == {'name': 'n'}
+        assert proc.reverse({'name': 'n', 'right': 1}) == \
+                    {'name': 'n', 'left': 1}
+        try:
+            proc.process({'left': 1})
+        except Error, e:
+            assert e.fields == ['name']
+        else:
+            assert False
+
+    def test_mapping_error_order(self):
+        proc = ArgProc()
+        proc.rules("""
+            $a:int => $x
+            $b => $y *
+            $c => $z
+            $d:int => $w
+            """)
+        plan = proc._plan('=>')
+        assert [ type(item).__name__ for item in plan.sequence ] == \
+                    ['Step', 'Mapping', 'Step']
+        assert_raises(ValidationError, proc.process, {'a': 'bad'})
+        try:
+            proc.process({'a': 1, 'd': 'bad'})
+        except Error, e:
+            assert e.fields == ['b']
+        else:
+            assert False
+
+    def test_mapping_ignore_none(self):
+        proc = ArgProc(ignore_none=True)
+        proc.rules("""
+            $left1 => $right1
+            $left2 => $right2
+            """)
+        left = {'left1': None, 'left2': 2}
+        assert proc.process(left) == {'right2': 2}
+
+    def test_shared_nodes(self):
+        proc1 = ArgProc()
+        proc1.rule("$id:int => $id *")
+        proc2 = ArgProc()
+        proc2.rules("""
+            $id:int => $objectid *
+            $flag:set((1, True)) => $flag
+            """)
+        rule1 = proc1._ruleset.rules[0]
+        rule2, rule3 = proc2._ruleset.rules
+        assert rule1.left is rule2.left
+        assert rule1.right is not rule2.right
+        values = rule3.left[1][1]
+        assert values[0] is not values[1]
+        assert proc1.process({'id': '1'}) == {'id': '1'}
+        assert_raises(Error, proc2.process, {'id': 'a'})
+
+    def test_attribute_reference(self):
+        import os
+        proc = ArgProc()
+        proc.rule('os.sep => $sep')
+        assert proc._ruleset.rules[0].tostring() == 'os.sep => $sep'
+        assert proc.process({}) == {'sep': os.sep}
+
+    def test_trusted(self):
+        def concat(*args):
+            return ''.join(map(str, args))
+        proc = ArgProc()
+        proc.rules("""
+            $id <=> $objectid:int *
+            concat($year:int, '-', $month:1..12) => $date
+            """)
+        right = {'objectid': 'a'}
+        assert_raises(Error, proc.reverse, right)
+        assert proc.reverse(right, trusted=True) == {'id': 'a'}
+        assert_raises(Error, proc.reverse, {}, trusted=True)
+        left = {'id': 1, 'year': 'x', 'month': 13}
+        assert_raises(Error, proc.process, left)
+        assert proc.process(left, trusted=True) == \
+                    {'objectid': 1, 'date': 'x-13'}
+        plan = proc._plan('<=', trusted=True)
+        assert plan.steps[0].ispec.tostring() == '$objectid'
+        assert plan is not proc._plan('<=')
+        proc.trusted = True
+        assert proc.reverse(right) == {'id': 'a'}
+        assert_raises(Error, proc.reverse, right, trusted=False)
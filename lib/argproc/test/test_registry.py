@@ -0,0 +1,57 @@
+#
+# This file is part of ArgProc. ArgProc is free software that is made
+# available under the MIT license. Consult the file "LICENSE" that is
+# distributed together with this file for the exact licensing terms.
+#
+# ArgProc is copyright (c) 2010 by the ArgProc authors. See the file
+# "AUTHORS" for a complete overview.
+
+from nose.tools import assert_raises
+
+from argproc import ArgumentProcessor as ArgProc
+from argproc import Registry
+
+
+class TestRegistry(object):
+
+    def test_register(self):
+        registry = Registry()
+        proc = ArgProc()
+        proc.rule('$left <=> $right')
+        assert registry.register('simple', proc) is proc
+        assert_raises(ValueError, registry.register, 'simple', proc)
+        assert registry.names() == ['simple']
+        assert registry.get('simple') is proc
+        assert len(proc._ruleset.plans) == 2
+        assert_raises(KeyError, registry.get, 'other')
+
+    def test_factory(self):
+        created = []
+        def create():
+            proc = ArgProc()
+            proc.rule('$left <=> $right')
+            created.append(proc)
+            return proc
+        registry = Registry()
+        registry.register('b', create)
+        registry.register('a', create)
+        assert created == []
+        assert registry.warm_up(freeze=False) == ['a', 'b']
+        assert len(created) == 2
+        proc = registry.get('b')
+        assert proc is created[1]
+        assert registry.get('b') is proc
+        assert len(created) == 2
+        directions = [ plan.direction for plan in proc._ruleset.plans.values() ]
+        assert sorted(directions) == ['<=', '=>']
+        assert proc.process({'left': 1}) == {'right': 1}
+
+    def test_lazy(self):
+        registry = Registry()
+        registry.register('lazy', lambda: ArgProc(namespace={}))
+        assert isinstance(registry.get('lazy'), ArgProc)
+
+    def test_freeze(self):
+        registry = Registry()
+        registry.register('simple', ArgProc())
+        assert registry.warm_up() == ['simple']
@@ -0,0 +1,100 @@
+#
+# This file is part of ArgProc. ArgProc is free software that is made
+# available under the MIT license. Consult the file "LICENSE" that is
+# distributed together with this file for the exact licensing terms.
+#
+# ArgProc is copyright (c) 2010 by the ArgProc authors. See the file
+# "AUTHORS" for a complete overview.
+
+import os
+import time
+import shutil
+import tempfile
+from nose.tools import assert_raises
+
+from argproc import Error
+from argproc.reload import FileProcessor
+
+
+class TestFileProcessor(object):
+
+    def setup(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.mtime = time.time() - 100
+
+    def teardown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def write(self, name, contents):
+        fname = os.path.join(self.tmpdir, name)
+        fout = file(fname, 'w')
+        fout.write(contents)
+        fout.close()
+        # Make sure the mtime changes, even on file systems with a coarse
+        # timestamp resolution.
+        self.mtime += 1
+        os.utime(fname, (self.mtime, self.mtime))
+        return fname
+
+    def test_load(self):
+        fname1 = self.write('a.rules', '$left1 <=> $right1')
+        fname2 = self.write('b.rules', '$left2 <=> $right2')
+        proc = FileProcessor([fname1, fname2], interval=None)
+        assert proc.process({'left1': 1, 'left2': 2}) == \
+                    {'right1': 1, 'right2': 2}
+        assert proc.reload() is False
+
+    def test_reload_changed_only(self):
+        fname1 = self.write('a.rules', '$left1 <=> $right1')
+        fname2 = self.write('b.rules', '$left2 <=> $right2')
+        proc = FileProcessor([fname1, fname2], interval=None)
+        rule1 = proc._ruleset.rules[0]
+        self.write('b.rules', '$left2 <=> $other')
+        assert proc.changed() == [fname2]
+        assert proc.reload() is True
+        assert proc._ruleset.rules[0] is rule1
+        assert proc.process({'left1': 1, 'left2': 2}) == \
+                    {'right1': 1, 'other': 2}
+
+    def test_reload_include(self):
+        fname1 = self.write('common.rules', '$left1 <=> $right1')
+        fname2 = self.write('a.rules', '#include common.rules\n'
+                                       '$left2 <=> $right2')
+        proc = FileProcessor([fname2], interval=None)
+        assert proc.process({'left1': 1, 'left2': 2}) == \
+                    {'right1': 1, 'right2': 2}
+        self.write('common.rules', '$left1 <=> $other')
+        assert proc.changed() == [fname1]
+        assert proc.reload() is True
+        assert proc.process({'left1': 1}) == {'other': 1}
+
+    def test_in_flight_plan(self):
+        fname = self.write('a.rules', '$left <=> $right')
+        proc = FileProcessor([fname], interval=None)
+        plan = proc._plan('=>')
+        self.write('a.rules', '$left <=> $other')
+        proc.reload()
+        assert proc._plan('=>') is not plan
+        assert plan.steps[0].rule.tostring() == '$left <=> $right'
+
+    def test_parse_error(self):
+        fname = self.write('a.rules', '$left <=> $right')
+        proc = FileProcessor([fname], interval=None)
+        self.write('a.rules', '$left <=> <=>')
+        assert proc.reload() is False
+        assert isinstance(proc.error, Error)
+        assert proc.process({'left': 1}) == {'right': 1}
+        assert_raises(Error, FileProcessor, [fname], interval=None)
+
+    def test_watch(self):
+        fname = self.write('a.rules', '$left <=> $right')
+        proc = FileProcessor([fname], interval=0.01)
+        try:
+            self.write('a.rules', '$left <=> $other')
+            for i in range(500):
+                if proc.process({'left': 1}) == {'other': 1}:
+                    break
+                time.sleep(0.01)
+            assert proc.process({'left': 1}) == {'other': 1}
+        finally:
+            proc.close()
@@ -0,0 +1,104 @@
+#
+# This file is part of ArgProc. ArgProc is free software that is made
+# available under the MIT license. Consult the file "LICENSE" that is
+# distributed together with this file for the exact licensing terms.
+#
+# ArgProc is copyright (c) 2010 by the ArgProc authors. See the file
+# "AUTHORS" for a complete overview.
+
+import logging
+
+from nose.tools import assert_raises
+
+from argproc import ArgumentProcessor as ArgProc
+from argproc import Error, Tracer, MemoryTracer, LoggingTracer
+
+
+class ListHandler(logging.Handler):
+
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class TestTracer(object):
+
+    def test_events(self):
+        tracer = MemoryTracer()
+        proc = ArgProc(tracer=tracer)
+        proc.rules("""
+            $left1 => $right1
+            $left2:int => $right2
+            """)
+        args = {'left1': 1}
+        assert proc.process(args) == {'right1': 1}
+        names = [ event[0] for event in tracer.events ]
+        assert names == ['process_start', 'rule_evaluated', 'rule_skipped',
+                         'process_end']
+        assert tracer.events[0] == ('process_start', '=>', args)
+        assert tracer.events[1][1].tostring() == '$left1 => $right1'
+        assert tracer.events[2][1].tostring() == '$left2:int => $right2'
+        assert tracer.events[3][2] == {'right1': 1}
+        assert tracer.events[3][3] is None
+
+    def test_failure(self):
+        tracer = MemoryTracer()
+        proc = ArgProc(tracer=tracer)
+        proc.rule('$left:int => $right')
+        assert_raises(Error, proc.process, {'left': 'a'})
+        names = [ event[0] for event in tracer.events ]
+        assert names == ['process_start', 'rule_failed', 'process_end']
+        error = tracer.events[1][2]
+        assert isinstance(error, Error)
+        assert tracer.events[2][2] is None
+        assert tracer.events[2][3] is error
+
+    def test_only(self):
+        tracer = MemoryTracer()
+        proc = ArgProc(tracer=tracer)
+        proc.rules("""
+            $left1 <=> $right1
+            $left2 <=> $right2
+            """)
+        assert proc.reverse({'right1': 1, 'right2': 2}, only=['left2']) == \
+                    {'left2': 2}
+        assert len(tracer.events) == 3
+        assert tracer.events[0][1] == '<='
+        assert tracer.events[1][1].tostring() == '$left2 <=> $right2'
+
+    def test_sampling(self):
+        tracer = MemoryTracer(sample=3)
+        proc = ArgProc(tracer=tracer)
+        proc.rule('$left => $right')
+        for i in range(9):
+            assert proc.process({'left': i}) == {'right': i}
+        starts = [ event for event in tracer.events
+                   if event[0] == 'process_start' ]
+        assert [ event[2]['left'] for event in starts ] == [2, 5, 8]
+        assert_raises(ValueError, Tracer, 0)
+
+    def test_logging(self):
+        handler = ListHandler()
+        logger = logging.getLogger('argproc.test')
+        logger.addHandler(handler)
+        logger.setLevel(logging.DEBUG)
+        try:
+            tracer = LoggingTracer(threshold=0, logger=logger)
+            proc = ArgProc(tracer=tracer)
+            proc.rule('$left => $right')
+            proc.process({'left': 1})
+            slow = [ record for record in handler.records
+                     if record.levelno == logging.WARNING ]
+            assert len(slow) == 1
+            assert '$left => $right' in slow[0].getMessage()
+            del handler.records[:]
+            tracer.threshold = 3600
+            proc.process({'left': 1})
+            assert len(handler.records) == 3
+            assert logging.WARNING not in \
+                    [ record.levelno for record in handler.records ]
+        finally:
+            logger.removeHandler(handler)
@@ -0,0 +1,64 @@
+#
+# This file is part of ArgProc. ArgProc is free software that is made
+# available under the MIT license. Consult the file "LICENSE" that is
+# distributed together with this file for the exact licensing terms.
+#
+# ArgProc is copyright (c) 2010 by the ArgProc authors. See the file
+# "AUTHORS" for a complete overview.
+
+from nose.tools import assert_raises
+
+from argproc import ArgumentProcessor as ArgProc
+from argproc import Error
+
+
+class TestZeroCopy(object):
+
+    def setup(self):
+        self.data = 'MAGC' + 'x' * 10000 + 'END'
+
+    def test_views(self):
+        proc = ArgProc(zero_copy=True)
+        proc.rules("""
+            $data[0:4] => $magic
+            $data[4:-3] => $body
+            $data[4:-3][0:2] => $head
+            $data => $data
+            """)
+        right = proc.process({'data': self.data})
+        assert isinstance(right['magic'], memoryview)
+        assert right['magic'].tobytes() == 'MAGC'
+        assert len(right['body']) == 10000
+        assert right['head'].tobytes() == 'xx'
+        assert right['data'] is self.data
+
+    def test_materialize(self):
+        proc = ArgProc(zero_copy=True)
+        proc.rules("""
+            len($data[4:-3]) => $size
+            str($data[0:4]) => $magic
+            $data[10004:10007].lower() => $end
+            """)
+        right = proc.process({'data': self.data})
+        assert right == {'size': 10000, 'magic': 'MAGC', 'end': 'end'}
+
+    def test_small(self):
+        proc = ArgProc(zero_copy=True)
+        proc.rule('$data[0:2] => $head')
+        assert proc.process({'data': 'abc'}) == {'head': 'ab'}
+        assert proc.process({'data': [1, 2, 3]}) == {'head': [1, 2]}
+        assert proc.process({'data': u'abc' * 5000})['head'] == u'ab'
+
+    def test_error(self):
+        proc = ArgProc(zero_copy=True)
+        proc.rule("$data['a':'b'] => $head")
+        assert_raises(Error, proc.process, {'data': self.data})
+
+    def test_plans(self):
+        proc = ArgProc()
+        proc.rule('$data[0:4] => $magic')
+        assert proc.process({'data': self.data}) == {'magic': 'MAGC'}
+        proc.zero_copy = True
+        assert isinstance(proc.process({'data': self.data})['magic'],
+                          memoryview)
+        assert proc.explain().count('Slicing') == 1
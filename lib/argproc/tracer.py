@@ -0,0 +1,113 @@
+#
+# This file is part of ArgProc. ArgProc is free software that is made
+# available under the MIT license. Consult the file "LICENSE" that is
+# distributed together with this file for the exact licensing terms.
+#
+# ArgProc is copyright (c) 2010 by the ArgProc authors. See the file
+# "AUTHORS" for a complete overview.
+
+import logging
+import itertools
+
+
+class Tracer(object):
+    """Base class for tracers.
+
+    A tracer is installed on a processor by setting its `tracer' attribute.
+    Only one in `sample' calls to process() or process_reverse() is traced.
+    For a traced call, the processor calls the event methods below. The
+    methods of this class do nothing; subclasses override the events they
+    are interested in.
+    """
+
+    def __init__(self, sample=1):
+        if sample < 1:
+            raise ValueError('sample should be at least 1')
+        self.sample = sample
+        self._counter = itertools.count(1)
+
+    def sampled(self):
+        """Return whether the next call should be traced."""
+        return self._counter.next() % self.sample == 0
+
+    def process_start(self, direction, args):
+        """Called before `args' are processed in `direction'."""
+
+    def process_end(self, direction, result, error, elapsed):
+        """Called after processing finished in `elapsed' seconds. Either
+        `result' or `error' is None."""
+
+    def rule_evaluated(self, rule, elapsed):
+        """Called after `rule' was evaluated in `elapsed' seconds."""
+
+    def rule_skipped(self, rule):
+        """Called when `rule' was not evaluated because its input fields
+        are missing."""
+
+    def rule_failed(self, rule, error, elapsed):
+        """Called when `rule' raised `error' after `elapsed' seconds."""
+
+
+class MemoryTracer(Tracer):
+    """A tracer that stores the events in `events', as tuples of the name of
+    the event and its arguments."""
+
+    def __init__(self, sample=1):
+        super(MemoryTracer, self).__init__(sample)
+        self.events = []
+
+    def clear(self):
+        del self.events[:]
+
+    def process_start(self, direction, args):
+        self.events.append(('process_start', direction, args))
+
+    def process_end(self, direction, result, error, elapsed):
+        self.events.append(('process_end', direction, result, error, elapsed))
+
+    def rule_evaluated(self, rule, elapsed):
+        self.events.append(('rule_evaluated', rule, elapsed))
+
+    def rule_skipped(self, rule):
+        self.events.append(('rule_skipped', rule))
+
+    def rule_failed(self, rule, error, elapsed):
+        self.events.append(('rule_failed', rule, error, elapsed))
+
+
+class LoggingTracer(Tracer):
+    """A tracer that logs rules that take `threshold' seconds or longer at
+    level WARNING, and the other events at level DEBUG."""
+
+    def __init__(self, threshold=0.001, logger=None, sample=1):
+        super(LoggingTracer, self).__init__(sample)
+        self.threshold = threshold
+        if logger is None:
+            logger = logging.getLogger('argproc')
+        self.logger = logger
+
+    def process_start(self, direction, args):
+        self.logger.debug('Processing %s', direction)
+
+    def process_end(self, direction, result, error, elapsed):
+        if error is None:
+            self.logger.debug('Processed %s in %.3f ms', direction,
+                              1e3 * elapsed)
+        else:
+            self.logger.debug('Processing %s failed in %.3f ms: %s',
+                              direction, 1e3 * elapsed, error)
+
+    def rule_evaluated(self, rule, elapsed):
+        if elapsed >= self.threshold:
+            self.logger.warning('Slow rule "%s": %.3f ms', rule.tostring(),
+                                1e3 * elapsed)
+        else:
+            self.logger.debug('Rule "%s": %.3f ms', rule.tostring(),
+                              1e3 * elapsed)
+
+    def rule_skipped(self, rule):
+        self.logger.debug('Rule "%s" skipped', rule.tostring())
+
+    def rule_failed(self, rule, error, elapsed):
+        self.logger.debug('Rule "%s" failed in %.3f ms: %s', rule.tostring(),
+                          1e3 * elapsed, error)
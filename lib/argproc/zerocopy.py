@@ -0,0 +1,82 @@
+#
+# This file is part of ArgProc. ArgProc is free software that is made
+# available under the MIT license. Consult the file "LICENSE" that is
+# distributed together with this file for the exact licensing terms.
+#
+# ArgProc is copyright (c) 2010 by the ArgProc authors. See the file
+# "AUTHORS" for a complete overview.
+
+from argproc.parser import Node, FunctionCall, AttributeReference, Slicing
+
+# Values that can be sliced without a copy through a memoryview.
+_bytes_types = (str, bytearray)
+
+
+class ViewSlicing(Slicing):
+    """A slicing that returns a memoryview, instead of a copy, of bytes-like
+    values of at least `size' bytes."""
+
+    def __init__(self, object, low, high, size):
+        super(ViewSlicing, self).__init__(object, low, high)
+        self.size = size
+
+    def eval(self, args, globals):
+        object = self[0].eval(args, globals)
+        if isinstance(object, _bytes_types) and len(object) >= self.size:
+            object = memoryview(object)
+        low = self[1].eval(args, globals)
+        high = self[2].eval(args, globals)
+        try:
+            return object[low:high]
+        except Exception, e:
+            self._eval_error(e)
+
+
+class Concrete(Node):
+    """Materialize the value of a subtree if it is a memoryview."""
+
+    def __init__(self, node):
+        super(Concrete, self).__init__(node)
+
+    def eval(self, args, globals):
+        value = self[0].eval(args, globals)
+        if isinstance(value, memoryview):
+            value = value.tobytes()
+        return value
+
+    def tostring(self):
+        return self[0].tostring()
+
+    def show_tree(self):
+        return self[0].show_tree()
+
+
+def _concrete(node):
+    """Return `node', materialized if it can evaluate to a view."""
+    if isinstance(node, ViewSlicing):
+        return Concrete(node)
+    return node
+
+
+def zero_copy(node, size):
+    """Return a copy of the tree `node' in which slicings return views of
+    bytes-like values of at least `size' bytes. The views are materialized
+    where they are passed to a function, or where an attribute of them is
+    used. A slice that is assigned to an output field stays a view."""
+    def convert(node):
+        for child in node.walk():
+            if isinstance(child, Slicing):
+                break
+        else:
+            return node
+        if isinstance(node, Slicing):
+            children = [ child.transform(convert) for child in node ]
+            return ViewSlicing(*children + [size])
+        elif isinstance(node, FunctionCall):
+            children = [ child.transform(convert) for child in node ]
+            arguments = [ _concrete(child) for child in children[1:] ]
+            return FunctionCall(_concrete(children[0]), arguments)
+        elif isinstance(node, AttributeReference):
+            object = _concrete(node[0].transform(convert))
+            return AttributeReference(object, node.attribute)
+    return node.transform(convert)